@@ -1,5 +1,6 @@
 import os
 import time
+from collections import OrderedDict
 from threading import RLock
 from typing import Optional
 from .config import settings
@@ -10,7 +11,8 @@ except ImportError:
     Redis = None  # type: ignore
 
 _redis = None
-_seen = {}
+# Insertion-ordered, so the oldest keys are always at the head
+_seen: "OrderedDict[str, float]" = OrderedDict()
 _lock = RLock()
 
 
@@ -51,13 +53,15 @@ def check_and_store(key: str) -> bool:
     # In-memory fallback
     now = time.time()
     with _lock:
-        # TTL purge
-        for k, (ts, _) in list(_seen.items()):
-            if now - ts > ttl_sec:
-                _seen.pop(k, None)
+        # TTL purge - pop expired keys off the head, stop at the first live one
+        while _seen:
+            ts = next(iter(_seen.values()))
+            if now - ts <= ttl_sec:
+                break
+            _seen.popitem(last=False)
 
         if key in _seen:
             return False
 
-        _seen[key] = (now, 1)
+        _seen[key] = now
         return True
\ No newline at end of file
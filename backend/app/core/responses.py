@@ -0,0 +1,43 @@
+from typing import Any, Tuple
+import hashlib
+
+import orjson
+from fastapi import Request, Response
+from fastapi.responses import JSONResponse
+
+_ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson (Rust serializer) instead of stdlib json."""
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=_ORJSON_OPTIONS)
+
+
+def make_etag(body: bytes) -> str:
+    """Strong ETag for a serialized response body"""
+    return f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+def prepare_json(content: Any) -> Tuple[bytes, str]:
+    """Serialize content once and return (body, etag) for reuse across requests"""
+    body = orjson.dumps(content, option=_ORJSON_OPTIONS)
+    return body, make_etag(body)
+
+
+def etag_bytes_response(request: Request, body: bytes, etag: str) -> Response:
+    """Send an already-serialized JSON body, or an empty 304 if the client has it"""
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+
+def etag_json_response(request: Request, content: Any) -> Response:
+    """
+    Serialize content and tag it with an ETag.
+    Returns an empty 304 when the client already holds the same body.
+    """
+    body, etag = prepare_json(content)
+    return etag_bytes_response(request, body, etag)
@@ -1,23 +1,21 @@
-from dotenv import load_dotenv
-from pathlib import Path
 import os
 
-# Load .env file before importing settings
-env_path = Path(__file__).parent.parent / ".env"
-load_dotenv(env_path)
+# Importing settings loads backend/.env (once, in core.config) before any
+# router reads the environment
+from .core.config import ENV_PATH, settings
 
 print(f"\n===== BACKEND STARTUP =====")
-print(f".env path: {env_path}")
-print(f".env exists: {env_path.exists()}")
+print(f".env path: {ENV_PATH}")
+print(f".env exists: {ENV_PATH.exists()}")
 print(f"API_TOKEN from env: {os.getenv('API_TOKEN', 'NOT_SET')}")
 print(f"Deployed from: main branch (auto-deploy test)")
 print(f"===========================\n", flush=True)
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from .core.config import settings
+from .core.responses import ORJSONResponse
 from .routers import health, settings as settings_router, portfolio, orders, stream, screening, market, ai, telemetry, strategies, scheduler, claude, market_data, news
-from .scheduler import init_scheduler
+from .scheduler import init_scheduler, get_scheduler
 import atexit
 
 print(f"\n===== SETTINGS LOADED =====")
@@ -27,7 +25,8 @@ print(f"===========================\n", flush=True)
 app = FastAPI(
     title="PaiiD Trading API",
     description="Personal Artificial Intelligence Investment Dashboard",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Initialize scheduler on startup
@@ -43,7 +42,6 @@ async def startup_event():
 @app.on_event("shutdown")
 async def shutdown_event():
     try:
-        from .scheduler import get_scheduler
         scheduler_instance = get_scheduler()
         scheduler_instance.shutdown()
         print("[OK] Scheduler shut down gracefully", flush=True)
@@ -6,9 +6,15 @@ Proxies Anthropic API calls from frontend to avoid exposing API key in browser
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 from typing import List, Optional
+from collections import OrderedDict
+from pathlib import Path
+from threading import Lock
+import asyncio
+import hashlib
+import orjson
 import os
 import sys
-from anthropic import Anthropic
+import time
 
 # Set UTF-8 encoding for console output on Windows
 if sys.platform == 'win32':
@@ -17,16 +23,105 @@ if sys.platform == 'win32':
 
 router = APIRouter(prefix="/claude", tags=["claude"])
 
-# Initialize Anthropic client with backend API key
+# Async Anthropic client with backend API key, built once on first use and
+# shared by every request (the SDK import alone costs over a second at startup).
+# Awaiting it keeps long completions off the worker threadpool
 anthropic_client = None
 api_key = os.getenv("ANTHROPIC_API_KEY")
 if api_key:
-    anthropic_client = Anthropic(api_key=api_key)
-    print(f"[Claude] Initialized with API key: {api_key[:10]}...")
+    print(f"[Claude] Configured with API key: {api_key[:10]}...")
 else:
     print("[Claude] WARNING: ANTHROPIC_API_KEY not found in environment")
 
 
+def get_anthropic_client():
+    """Process-wide AsyncAnthropic client, or None when no API key is set"""
+    global anthropic_client
+    if anthropic_client is None and api_key:
+        from anthropic import AsyncAnthropic
+        anthropic_client = AsyncAnthropic(api_key=api_key)
+    return anthropic_client
+
+
+# Repeated prompts (dashboard quick actions, re-sent questions) are answered
+# from memory instead of another full Claude round-trip. Keys are exact over
+# the raw strings - no embeddings or normalisation, so no false "similar" hits.
+# Mirrored to disk so a redeploy or restart doesn't start cold. The key holds
+# no live market or portfolio state (the frontend sends no system prompt), so
+# a repeated question gets the same answer until the entry expires - keep the
+# TTL short. CLAUDE_CACHE_TTL=0 disables caching
+CHAT_CACHE_TTL = int(os.getenv("CLAUDE_CACHE_TTL", "300"))  # seconds
+CHAT_CACHE_MAX = 128
+# Anchored to backend/ like core.config.ENV_PATH, not the working directory
+CHAT_CACHE_FILE = Path(__file__).parent.parent.parent / "data" / "claude_cache.json"
+_chat_cache: "OrderedDict[str, tuple]" = OrderedDict()  # key -> (ts, ChatResponse)
+_chat_cache_lock = Lock()
+_chat_cache_write_lock = Lock()  # serialises disk writes; never taken on the event loop
+
+
+def _chat_cache_key(request: "ChatRequest") -> str:
+    """Digest of everything that shapes the completion"""
+    payload = orjson.dumps([
+        request.model,
+        request.max_tokens,
+        request.system,
+        [[m.role, m.content] for m in request.messages],
+    ])
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _chat_cache_get(key: str) -> Optional["ChatResponse"]:
+    with _chat_cache_lock:
+        hit = _chat_cache.get(key)
+        if hit is None:
+            return None
+        if time.time() - hit[0] >= CHAT_CACHE_TTL:
+            del _chat_cache[key]
+            return None
+        _chat_cache.move_to_end(key)
+        return hit[1]
+
+
+def _chat_cache_set(key: str, response: "ChatResponse") -> None:
+    with _chat_cache_lock:
+        _chat_cache[key] = (time.time(), response)
+        _chat_cache.move_to_end(key)
+        if len(_chat_cache) > CHAT_CACHE_MAX:
+            _chat_cache.popitem(last=False)
+
+
+def _save_chat_cache() -> None:
+    """
+    Write the cache to disk; best effort. Blocking, so run it in a worker
+    thread. The snapshot is taken under the write lock, so the last write
+    always carries the newest entries, and the cache lock is released
+    before any file I/O.
+    """
+    with _chat_cache_write_lock:
+        with _chat_cache_lock:
+            entries = [[k, ts, r.model_dump()] for k, (ts, r) in _chat_cache.items()]
+        try:
+            CHAT_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            tmp = CHAT_CACHE_FILE.with_suffix(".tmp")
+            tmp.write_bytes(orjson.dumps(entries))
+            os.replace(tmp, CHAT_CACHE_FILE)
+        except OSError as e:
+            print(f"[Claude] Could not persist response cache: {e}")
+
+
+def _load_chat_cache() -> None:
+    """Restore unexpired entries saved by a previous process"""
+    now = time.time()
+    try:
+        entries = orjson.loads(CHAT_CACHE_FILE.read_bytes())
+        with _chat_cache_lock:
+            for key, ts, response in entries[-CHAT_CACHE_MAX:]:
+                if now - ts < CHAT_CACHE_TTL:
+                    _chat_cache[key] = (ts, ChatResponse(**response))
+    except (OSError, ValueError, TypeError):
+        pass  # missing or unreadable cache file - start empty
+
+
 class Message(BaseModel):
     role: str
     content: str
@@ -45,6 +140,9 @@ class ChatResponse(BaseModel):
     role: str = "assistant"
 
 
+_load_chat_cache()
+
+
 @router.post("/chat", response_model=ChatResponse)
 async def claude_chat(request: ChatRequest):
     """
@@ -52,12 +150,18 @@ async def claude_chat(request: ChatRequest):
 
     This prevents exposing the Anthropic API key in the browser
     """
-    if not anthropic_client:
+    client = get_anthropic_client()
+    if not client:
         raise HTTPException(
             status_code=503,
             detail="Claude API not configured. Set ANTHROPIC_API_KEY in backend .env"
         )
 
+    cache_key = _chat_cache_key(request)
+    cached = _chat_cache_get(cache_key)
+    if cached is not None:
+        return cached
+
     try:
         # Convert Pydantic models to dicts for Anthropic SDK
         messages = [{"role": msg.role, "content": msg.content} for msg in request.messages]
@@ -76,7 +180,7 @@ async def claude_chat(request: ChatRequest):
             else:
                 kwargs["system"] = request.system
 
-        response = anthropic_client.messages.create(**kwargs)
+        response = await client.messages.create(**kwargs)
 
         # Extract text content
         content = ""
@@ -84,11 +188,15 @@ async def claude_chat(request: ChatRequest):
             if response.content[0].type == "text":
                 content = response.content[0].text
 
-        return ChatResponse(
+        result = ChatResponse(
             content=content,
             model=response.model,
             role="assistant"
         )
+        if content and CHAT_CACHE_TTL > 0:
+            _chat_cache_set(cache_key, result)
+            await asyncio.to_thread(_save_chat_cache)
+        return result
 
     except Exception as e:
         # Safe error logging for Windows console
@@ -107,7 +215,7 @@ async def claude_chat(request: ChatRequest):
 @router.get("/health")
 async def claude_health():
     """Check if Claude API is configured and accessible"""
-    if not anthropic_client:
+    if not api_key:
         return {
             "status": "unavailable",
             "message": "ANTHROPIC_API_KEY not configured"
@@ -1,11 +1,12 @@
 """
 Market conditions and analysis endpoints
 """
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from typing import List, Literal
 from pydantic import BaseModel
 from ..core.auth import require_bearer
 from ..core.config import settings
+from ..core.responses import etag_bytes_response, prepare_json
 import requests
 
 router = APIRouter(tags=["market"])
@@ -18,8 +19,62 @@ class MarketCondition(BaseModel):
     details: str | None = None
 
 
+# Mock market conditions - replace with real data.
+# Static until real data is wired in, so the response is built once at import.
+_MARKET_CONDITIONS: List[MarketCondition] = [
+    MarketCondition(
+        name="VIX (Volatility)",
+        value="14.2",
+        status="favorable",
+        details="Below 20 indicates calm market, good for directional trades"
+    ),
+    MarketCondition(
+        name="SPY Trend",
+        value="Uptrend",
+        status="favorable",
+        details="Price above 50-day and 200-day moving averages"
+    ),
+    MarketCondition(
+        name="Market Breadth",
+        value="68% bullish",
+        status="favorable",
+        details="Advance/decline ratio: 2.1, showing broad participation"
+    ),
+    MarketCondition(
+        name="Volume",
+        value="Above average",
+        status="neutral",
+        details="110% of 20-day average volume"
+    ),
+    MarketCondition(
+        name="Sector Rotation",
+        value="Tech leading",
+        status="favorable",
+        details="Technology and Communication Services outperforming"
+    ),
+    MarketCondition(
+        name="Put/Call Ratio",
+        value="0.82",
+        status="neutral",
+        details="Moderate sentiment, not overly bullish or bearish"
+    )
+]
+
+_CONDITIONS_RESPONSE = {
+    "conditions": [cond.model_dump() for cond in _MARKET_CONDITIONS],
+    "timestamp": "2025-10-06T00:00:00Z",
+    "overallSentiment": "bullish",  # calculated from conditions
+    "recommendedActions": [
+        "Consider directional bullish strategies",
+        "Monitor tech sector for momentum plays",
+        "Watch for volume confirmation on breakouts"
+    ]
+}
+_CONDITIONS_BODY, _CONDITIONS_ETAG = prepare_json(_CONDITIONS_RESPONSE)
+
+
 @router.get("/market/conditions", dependencies=[Depends(require_bearer)])
-async def get_market_conditions() -> dict:
+async def get_market_conditions(request: Request) -> Response:
     """
     Get current market conditions for trading analysis
 
@@ -30,61 +85,27 @@ async def get_market_conditions() -> dict:
     - Volume analysis compared to averages
     - Sector rotation analysis
     """
-
-    # Mock market conditions - replace with real data
-    conditions: List[MarketCondition] = [
-        MarketCondition(
-            name="VIX (Volatility)",
-            value="14.2",
-            status="favorable",
-            details="Below 20 indicates calm market, good for directional trades"
-        ),
-        MarketCondition(
-            name="SPY Trend",
-            value="Uptrend",
-            status="favorable",
-            details="Price above 50-day and 200-day moving averages"
-        ),
-        MarketCondition(
-            name="Market Breadth",
-            value="68% bullish",
-            status="favorable",
-            details="Advance/decline ratio: 2.1, showing broad participation"
-        ),
-        MarketCondition(
-            name="Volume",
-            value="Above average",
-            status="neutral",
-            details="110% of 20-day average volume"
-        ),
-        MarketCondition(
-            name="Sector Rotation",
-            value="Tech leading",
-            status="favorable",
-            details="Technology and Communication Services outperforming"
-        ),
-        MarketCondition(
-            name="Put/Call Ratio",
-            value="0.82",
-            status="neutral",
-            details="Moderate sentiment, not overly bullish or bearish"
-        )
-    ]
-
-    return {
-        "conditions": [cond.model_dump() for cond in conditions],
-        "timestamp": "2025-10-06T00:00:00Z",
-        "overallSentiment": "bullish",  # calculated from conditions
-        "recommendedActions": [
-            "Consider directional bullish strategies",
-            "Monitor tech sector for momentum plays",
-            "Watch for volume confirmation on breakouts"
-        ]
+    return etag_bytes_response(request, _CONDITIONS_BODY, _CONDITIONS_ETAG)
+
+
+# Mock Dow/NASDAQ levels served when the Alpaca snapshot fails. Static and
+# only read, so it is built once at import rather than on every fallback.
+_FALLBACK_INDICES = {
+    "dow": {
+        "last": 42500.00,
+        "change": 125.50,
+        "changePercent": 0.30
+    },
+    "nasdaq": {
+        "last": 18350.00,
+        "change": 98.75,
+        "changePercent": 0.54
     }
+}
 
 
 @router.get("/market/indices", dependencies=[Depends(require_bearer)])
-async def get_major_indices() -> dict:
+def get_major_indices() -> dict:
     """
     Get current prices for Dow Jones Industrial and NASDAQ Composite using live Alpaca snapshot data
     Returns data in format: { dow: {...}, nasdaq: {...} }
@@ -98,22 +119,18 @@ async def get_major_indices() -> dict:
             "APCA-API-SECRET-KEY": settings.ALPACA_SECRET_KEY
         }
 
-        # Fetch latest quotes for each symbol
+        # Fetch latest bars for all symbols in one multi-symbol request
         all_bars = {}
-        for symbol in symbols:
-            try:
-                resp = requests.get(
-                    f"{settings.ALPACA_BASE_URL}/v2/stocks/{symbol}/bars/latest",
-                    headers=headers,
-                    params={"feed": "iex"}  # Use IEX feed for paper trading
-                )
-                if resp.status_code == 200:
-                    symbol_data = resp.json()
-                    if "bar" in symbol_data:
-                        all_bars[symbol] = symbol_data["bar"]
-            except Exception as e:
-                print(f"Error fetching {symbol}: {e}")
-                continue
+        try:
+            resp = requests.get(
+                f"{settings.ALPACA_BASE_URL}/v2/stocks/bars/latest",
+                headers=headers,
+                params={"symbols": ",".join(symbols), "feed": "iex"}  # Use IEX feed for paper trading
+            )
+            if resp.status_code == 200:
+                all_bars = resp.json().get("bars", {})
+        except Exception as e:
+            print(f"Error fetching {symbols}: {e}")
 
         # Process results
         dow_data = {}
@@ -157,44 +174,37 @@ async def get_major_indices() -> dict:
     except Exception as e:
         print(f"Error fetching live market data: {e}")
         # Fallback to mock data if API fails
-        return {
-            "dow": {
-                "last": 42500.00,
-                "change": 125.50,
-                "changePercent": 0.30
-            },
-            "nasdaq": {
-                "last": 18350.00,
-                "change": 98.75,
-                "changePercent": 0.54
-            }
-        }
+        return _FALLBACK_INDICES
+
+
+_SECTORS = [
+    {"name": "Technology", "symbol": "XLK", "changePercent": 1.8, "rank": 1},
+    {"name": "Communication", "symbol": "XLC", "changePercent": 1.5, "rank": 2},
+    {"name": "Consumer Discretionary", "symbol": "XLY", "changePercent": 0.9, "rank": 3},
+    {"name": "Financials", "symbol": "XLF", "changePercent": 0.6, "rank": 4},
+    {"name": "Healthcare", "symbol": "XLV", "changePercent": 0.4, "rank": 5},
+    {"name": "Industrials", "symbol": "XLI", "changePercent": 0.2, "rank": 6},
+    {"name": "Materials", "symbol": "XLB", "changePercent": -0.1, "rank": 7},
+    {"name": "Real Estate", "symbol": "XLRE", "changePercent": -0.3, "rank": 8},
+    {"name": "Utilities", "symbol": "XLU", "changePercent": -0.5, "rank": 9},
+    {"name": "Energy", "symbol": "XLE", "changePercent": -1.2, "rank": 10},
+    {"name": "Consumer Staples", "symbol": "XLP", "changePercent": -0.8, "rank": 11}
+]
+
+_SECTORS_RESPONSE = {
+    "sectors": _SECTORS,
+    "timestamp": "2025-10-06T00:00:00Z",
+    "leader": "Technology",
+    "laggard": "Energy"
+}
+_SECTORS_BODY, _SECTORS_ETAG = prepare_json(_SECTORS_RESPONSE)
 
 
 @router.get("/market/sectors", dependencies=[Depends(require_bearer)])
-async def get_sector_performance() -> dict:
+async def get_sector_performance(request: Request) -> Response:
     """
     Get performance of major market sectors
 
     TODO: Fetch real sector ETF data
     """
-    sectors = [
-        {"name": "Technology", "symbol": "XLK", "changePercent": 1.8, "rank": 1},
-        {"name": "Communication", "symbol": "XLC", "changePercent": 1.5, "rank": 2},
-        {"name": "Consumer Discretionary", "symbol": "XLY", "changePercent": 0.9, "rank": 3},
-        {"name": "Financials", "symbol": "XLF", "changePercent": 0.6, "rank": 4},
-        {"name": "Healthcare", "symbol": "XLV", "changePercent": 0.4, "rank": 5},
-        {"name": "Industrials", "symbol": "XLI", "changePercent": 0.2, "rank": 6},
-        {"name": "Materials", "symbol": "XLB", "changePercent": -0.1, "rank": 7},
-        {"name": "Real Estate", "symbol": "XLRE", "changePercent": -0.3, "rank": 8},
-        {"name": "Utilities", "symbol": "XLU", "changePercent": -0.5, "rank": 9},
-        {"name": "Energy", "symbol": "XLE", "changePercent": -1.2, "rank": 10},
-        {"name": "Consumer Staples", "symbol": "XLP", "changePercent": -0.8, "rank": 11}
-    ]
-
-    return {
-        "sectors": sectors,
-        "timestamp": "2025-10-06T00:00:00Z",
-        "leader": "Technology",
-        "laggard": "Energy"
-    }
+    return etag_bytes_response(request, _SECTORS_BODY, _SECTORS_ETAG)
@@ -1,14 +1,19 @@
 from fastapi import APIRouter, Depends, HTTPException
 from app.core.auth import require_bearer
-from alpaca.data.historical import StockHistoricalDataClient
-from alpaca.data.requests import StockLatestQuoteRequest, StockBarsRequest
-from alpaca.data.timeframe import TimeFrame
+import asyncio
 import os
+import re
+import time
+from functools import lru_cache
 from datetime import datetime, timedelta
 
 router = APIRouter()
 
-# Initialize Alpaca data client (lazy to avoid CI failures)
+# alpaca-py is synchronous; handlers run its calls via asyncio.to_thread so
+# a slow Alpaca response doesn't stall the event loop for other requests
+
+# Initialize Alpaca data client (lazy to avoid CI failures). alpaca-py itself
+# is imported on first use too - it costs most of a second at startup
 data_client = None
 
 def get_data_client():
@@ -19,16 +24,46 @@ def get_data_client():
         secret_key = os.getenv("APCA_API_SECRET_KEY") or os.getenv("ALPACA_SECRET_KEY")
         if not api_key or not secret_key:
             raise HTTPException(status_code=500, detail="Alpaca API credentials not configured")
+        from alpaca.data.historical import StockHistoricalDataClient
         data_client = StockHistoricalDataClient(api_key=api_key, secret_key=secret_key)
     return data_client
 
+# Latest quotes are reused for a few seconds so dashboards polling the same
+# symbols (and the scanner's fixed universe) don't each round-trip to Alpaca
+QUOTE_CACHE_TTL = 5  # seconds
+_quote_cache = {}  # symbol -> (monotonic ts, alpaca Quote)
+
+# Plain tickers plus share-class suffixes like BRK.B
+SYMBOL_RE = re.compile(r"^[A-Z]{1,5}(\.[A-Z]{1,2})?$")
+
+async def _latest_quotes(symbols: list) -> dict:
+    """Latest quotes for symbols, fetching only the ones not cached recently"""
+    now = time.monotonic()
+    result = {}
+    missing = []
+    for symbol in symbols:
+        hit = _quote_cache.get(symbol)
+        if hit and now - hit[0] < QUOTE_CACHE_TTL:
+            result[symbol] = hit[1]
+        else:
+            missing.append(symbol)
+
+    if missing:
+        from alpaca.data.requests import StockLatestQuoteRequest
+        client = get_data_client()
+        request = StockLatestQuoteRequest(symbol_or_symbols=missing)
+        fetched = await asyncio.to_thread(client.get_stock_latest_quote, request)
+        for symbol, quote in fetched.items():
+            _quote_cache[symbol] = (now, quote)
+            result[symbol] = quote
+
+    return result
+
 @router.get("/market/quote/{symbol}")
 async def get_quote(symbol: str):
     """Get real-time quote for a symbol"""
     try:
-        client = get_data_client()
-        request = StockLatestQuoteRequest(symbol_or_symbols=symbol)
-        quotes = client.get_stock_latest_quote(request)
+        quotes = await _latest_quotes([symbol])
 
         quote = quotes[symbol]
         return {
@@ -46,10 +81,12 @@ async def get_quote(symbol: str):
 async def get_quotes(symbols: str):
     """Get quotes for multiple symbols (comma-separated)"""
     try:
-        client = get_data_client()
-        symbol_list = symbols.upper().split(',')
-        request = StockLatestQuoteRequest(symbol_or_symbols=symbol_list)
-        quotes = client.get_stock_latest_quote(request)
+        # Drop malformed symbols before the batch request so one typo can't
+        # fail the whole Alpaca call; they're simply absent from the result
+        symbol_list = [s for s in dict.fromkeys(symbols.upper().replace(' ', '').split(',')) if SYMBOL_RE.match(s)]
+        if not symbol_list:
+            return {}
+        quotes = await _latest_quotes(symbol_list)
 
         result = {}
         for symbol in symbol_list:
@@ -66,72 +103,79 @@ async def get_quotes(symbols: str):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@lru_cache(maxsize=256)
+def _fetch_bars(symbol: str, timeframe: str, limit: int, bucket: int) -> dict:
+    """Fetch and shape bars; cached per minute bucket so hot symbols skip Alpaca"""
+    from alpaca.data.requests import StockBarsRequest
+    from alpaca.data.timeframe import TimeFrame
+
+    # Map timeframe string to Alpaca TimeFrame
+    tf_map = {
+        "1Min": TimeFrame.Minute,
+        "5Min": TimeFrame(5, "Min"),
+        "1Hour": TimeFrame.Hour,
+        "1Day": TimeFrame.Day
+    }
+
+    tf = tf_map.get(timeframe, TimeFrame.Day)
+
+    client = get_data_client()
+    request = StockBarsRequest(
+        symbol_or_symbols=symbol,
+        timeframe=tf,
+        limit=limit
+    )
+
+    bars = client.get_stock_bars(request)
+
+    result = []
+    for bar in bars[symbol]:
+        result.append({
+            "timestamp": bar.timestamp.isoformat(),
+            "open": float(bar.open),
+            "high": float(bar.high),
+            "low": float(bar.low),
+            "close": float(bar.close),
+            "volume": int(bar.volume)
+        })
+
+    return {"symbol": symbol, "bars": result}
+
 @router.get("/market/bars/{symbol}")
 async def get_bars(symbol: str, timeframe: str = "1Day", limit: int = 100):
     """Get historical price bars"""
     try:
-        # Map timeframe string to Alpaca TimeFrame
-        tf_map = {
-            "1Min": TimeFrame.Minute,
-            "5Min": TimeFrame(5, "Min"),
-            "1Hour": TimeFrame.Hour,
-            "1Day": TimeFrame.Day
-        }
-
-        tf = tf_map.get(timeframe, TimeFrame.Day)
-
-        client = get_data_client()
-        request = StockBarsRequest(
-            symbol_or_symbols=symbol,
-            timeframe=tf,
-            limit=limit
-        )
-
-        bars = client.get_stock_bars(request)
-
-        result = []
-        for bar in bars[symbol]:
-            result.append({
-                "timestamp": bar.timestamp.isoformat(),
-                "open": float(bar.open),
-                "high": float(bar.high),
-                "low": float(bar.low),
-                "close": float(bar.close),
-                "volume": int(bar.volume)
-            })
-
-        return {"symbol": symbol, "bars": result}
+        # Old buckets age out of the LRU on their own once the minute rolls over
+        bucket = int(time.time() // 60)
+        return await asyncio.to_thread(_fetch_bars, symbol, timeframe, limit, bucket)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+# Pre-defined list of liquid stocks that trade near/under $4
+UNDER4_CANDIDATES = [
+    "SOFI", "PLUG", "RIOT", "NIO", "F", "VALE",
+    "BTG", "GOLD", "SIRI", "TLRY", "SNAP", "BBD"
+]
+
 @router.get("/market/scanner/under4")
 async def scan_under_4():
     """Scan for stocks under $4 with volume"""
     try:
-        # Pre-defined list of liquid stocks that trade near/under $4
-        candidates = [
-            "SOFI", "PLUG", "RIOT", "NIO", "F", "VALE",
-            "BTG", "GOLD", "SIRI", "TLRY", "SNAP", "BBD"
-        ]
-
-        client = get_data_client()
-        request = StockLatestQuoteRequest(symbol_or_symbols=candidates)
-        quotes = client.get_stock_latest_quote(request)
+        quotes = await _latest_quotes(UNDER4_CANDIDATES)
 
+        # Only walk the symbols Alpaca actually returned
         results = []
-        for symbol in candidates:
-            if symbol in quotes:
-                q = quotes[symbol]
-                price = float(q.ask_price)
+        for symbol, q in quotes.items():
+            price = float(q.ask_price)
 
-                if price < 4.00 and price > 0.50:  # Filter under $4, above $0.50
-                    results.append({
-                        "symbol": symbol,
-                        "price": price,
-                        "bid": float(q.bid_price),
-                        "ask": float(q.ask_price),
-                        "timestamp": q.timestamp.isoformat()
-                    })
+            if 0.50 < price < 4.00:  # Filter under $4, above $0.50
+                results.append({
+                    "symbol": symbol,
+                    "price": price,
+                    "bid": float(q.bid_price),
+                    "ask": price,
+                    "timestamp": q.timestamp.isoformat()
+                })
 
         # Sort by price ascending
         results.sort(key=lambda x: x["price"])
@@ -139,40 +183,3 @@ async def scan_under_4():
         return {"candidates": results, "count": len(results)}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
-
-@router.get("/market/indices")
-async def get_indices():
-    """Get major market indices (SPY, QQQ, DIA, IWM)"""
-    try:
-        client = get_data_client()
-        symbols = ["SPY", "QQQ", "DIA", "IWM"]
-        request = StockLatestQuoteRequest(symbol_or_symbols=symbols)
-        quotes = client.get_stock_latest_quote(request)
-
-        result = {}
-        for symbol in symbols:
-            if symbol in quotes:
-                q = quotes[symbol]
-                price = float(q.ask_price)
-
-                # Get previous close for % change calculation
-                bars_request = StockBarsRequest(
-                    symbol_or_symbols=symbol,
-                    timeframe=TimeFrame.Day,
-                    limit=2
-                )
-                bars = client.get_stock_bars(bars_request)
-
-                prev_close = float(bars[symbol][0].close) if len(bars[symbol]) > 0 else price
-                pct_change = ((price - prev_close) / prev_close) * 100
-
-                result[symbol] = {
-                    "price": price,
-                    "prev_close": prev_close,
-                    "change": price - prev_close,
-                    "change_pct": round(pct_change, 2)
-                }
-
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
@@ -14,7 +14,7 @@ except Exception as e:
     print(f"[WARNING] News aggregator failed to initialize: {e}")
 
 @router.get("/news/company/{symbol}")
-async def get_company_news(symbol: str, days_back: int = 7, _: str = Depends(require_bearer)):
+def get_company_news(symbol: str, days_back: int = 7, _: str = Depends(require_bearer)):
     """Get aggregated news for specific company"""
     if not news_aggregator:
         raise HTTPException(status_code=503, detail="News service unavailable")
@@ -31,7 +31,7 @@ async def get_company_news(symbol: str, days_back: int = 7, _: str = Depends(req
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/news/market")
-async def get_market_news(category: str = 'general', limit: int = 50, _: str = Depends(require_bearer)):
+def get_market_news(category: str = 'general', limit: int = 50, _: str = Depends(require_bearer)):
     """Get aggregated market news"""
     if not news_aggregator:
         raise HTTPException(status_code=503, detail="News service unavailable")
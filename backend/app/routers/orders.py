@@ -14,6 +14,10 @@ ALPACA_API_KEY = os.getenv("ALPACA_API_KEY")
 ALPACA_SECRET_KEY = os.getenv("ALPACA_SECRET_KEY")
 ALPACA_BASE_URL = "https://paper-api.alpaca.markets"  # Paper trading
 
+# One session for all order traffic: auth headers are set once and the
+# keep-alive pool reuses the TLS connection across orders and requests
+_alpaca_session = None
+
 def get_alpaca_headers():
     """Get headers for Alpaca API requests"""
     return {
@@ -21,6 +25,14 @@ def get_alpaca_headers():
         "APCA-API-SECRET-KEY": ALPACA_SECRET_KEY,
     }
 
+def get_alpaca_session() -> requests.Session:
+    """Shared, pre-authenticated Alpaca HTTP session"""
+    global _alpaca_session
+    if _alpaca_session is None:
+        _alpaca_session = requests.Session()
+        _alpaca_session.headers.update(get_alpaca_headers())
+    return _alpaca_session
+
 class Order(BaseModel):
     symbol: str
     side: str
@@ -49,11 +61,11 @@ def execute(req: ExecRequest, _=Depends(require_bearer)):
 
     # Execute real trades via Alpaca API
     executed_orders = []
+    session = get_alpaca_session()
     for order in req.orders:
         try:
-            response = requests.post(
+            response = session.post(
                 f"{ALPACA_BASE_URL}/v2/orders",
-                headers=get_alpaca_headers(),
                 json={
                     "symbol": order.symbol,
                     "qty": order.qty,
@@ -1,15 +1,22 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from pydantic import BaseModel
 from typing import Optional, Literal
 from ..core.auth import require_bearer
 from ..core.config import settings
+from ..core.responses import etag_json_response
 from ..services.tradier_client import get_tradier_client
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Dashboards poll the account on every refresh; reuse the Tradier snapshot for
+# a few seconds instead of a broker round-trip per poll
+ACCOUNT_CACHE_TTL = 10  # seconds
+_account_cache = {"t": 0.0, "v": None}
+
 class AlpacaAccount(BaseModel):
     """Alpaca account information"""
     id: str
@@ -45,10 +52,16 @@ def get_account(_=Depends(require_bearer)):
     logger.info("🎯 ACCOUNT ENDPOINT - Tradier Production")
 
     try:
+        now = time.time()
+        if _account_cache["v"] is not None and now - _account_cache["t"] < ACCOUNT_CACHE_TTL:
+            return _account_cache["v"]
+
         client = get_tradier_client()
         account_data = client.get_account()
 
         logger.info("✅ Tradier account data retrieved successfully")
+        _account_cache["t"] = now
+        _account_cache["v"] = account_data
         return account_data
 
     except Exception as e:
@@ -59,13 +72,13 @@ def get_account(_=Depends(require_bearer)):
         )
 
 @router.get("/positions")
-def get_positions(_=Depends(require_bearer)):
-    """Get Tradier positions"""
+def get_positions(request: Request, _=Depends(require_bearer)):
+    """Get Tradier positions (ETag'd so unchanged polls get a 304)"""
     try:
         client = get_tradier_client()
         positions = client.get_positions()
         logger.info(f"✅ Retrieved {len(positions)} positions from Tradier")
-        return positions
+        return etag_json_response(request, positions)
 
     except Exception as e:
         logger.error(f"❌ Tradier positions request failed: {str(e)}")
@@ -7,8 +7,9 @@ from fastapi import APIRouter, HTTPException, status, Depends
 from typing import List, Optional
 from datetime import datetime, timedelta
 from pydantic import BaseModel
+import heapq
 import uuid
-import json
+import orjson
 from pathlib import Path
 
 from ..scheduler import get_scheduler, SCHEDULES_DIR, EXECUTIONS_DIR, APPROVALS_DIR
@@ -101,16 +102,16 @@ def _load_schedule(schedule_id: str) -> Optional[dict]:
     """Load schedule from file"""
     schedule_file = SCHEDULES_DIR / f"{schedule_id}.json"
     if schedule_file.exists():
-        with open(schedule_file, 'r') as f:
-            return json.load(f)
+        with open(schedule_file, 'rb') as f:
+            return orjson.loads(f.read())
     return None
 
 
 def _save_schedule(schedule: dict):
     """Save schedule to file"""
     schedule_file = SCHEDULES_DIR / f"{schedule['id']}.json"
-    with open(schedule_file, 'w') as f:
-        json.dump(schedule, f, indent=2)
+    with open(schedule_file, 'wb') as f:
+        f.write(orjson.dumps(schedule, option=orjson.OPT_INDENT_2))
 
 
 def _delete_schedule_file(schedule_id: str):
@@ -124,8 +125,8 @@ def _load_all_schedules() -> List[dict]:
     """Load all schedules from files"""
     schedules = []
     for schedule_file in SCHEDULES_DIR.glob("*.json"):
-        with open(schedule_file, 'r') as f:
-            schedules.append(json.load(f))
+        with open(schedule_file, 'rb') as f:
+            schedules.append(orjson.loads(f.read()))
     return sorted(schedules, key=lambda x: x.get('created_at', ''), reverse=True)
 
 
@@ -133,14 +134,13 @@ def _load_executions(limit: int = 20, schedule_id: Optional[str] = None) -> List
     """Load execution history from files"""
     executions = []
     for exec_file in EXECUTIONS_DIR.glob("*.json"):
-        with open(exec_file, 'r') as f:
-            execution = json.load(f)
+        with open(exec_file, 'rb') as f:
+            execution = orjson.loads(f.read())
             if schedule_id is None or execution['schedule_id'] == schedule_id:
                 executions.append(execution)
 
-    # Sort by started_at descending
-    executions = sorted(executions, key=lambda x: x.get('started_at', ''), reverse=True)
-    return executions[:limit]
+    # Newest `limit` by started_at, without sorting the whole history
+    return heapq.nlargest(limit, executions, key=lambda x: x.get('started_at', ''))
 
 
 def _load_pending_approvals() -> List[dict]:
@@ -149,8 +149,8 @@ def _load_pending_approvals() -> List[dict]:
     now = datetime.utcnow()
 
     for approval_file in APPROVALS_DIR.glob("*.json"):
-        with open(approval_file, 'r') as f:
-            approval = json.load(f)
+        with open(approval_file, 'rb') as f:
+            approval = orjson.loads(f.read())
             # Only include pending and not expired
             if approval['status'] == 'pending':
                 expires_at = datetime.fromisoformat(approval['expires_at'])
@@ -164,11 +164,11 @@ def _update_approval(approval_id: str, updates: dict):
     """Update approval file"""
     approval_file = APPROVALS_DIR / f"{approval_id}.json"
     if approval_file.exists():
-        with open(approval_file, 'r') as f:
-            approval = json.load(f)
+        with open(approval_file, 'rb') as f:
+            approval = orjson.loads(f.read())
         approval.update(updates)
-        with open(approval_file, 'w') as f:
-            json.dump(approval, f, indent=2)
+        with open(approval_file, 'wb') as f:
+            f.write(orjson.dumps(approval, option=orjson.OPT_INDENT_2))
 
 
 # ========================
@@ -176,7 +176,7 @@ def _update_approval(approval_id: str, updates: dict):
 # ========================
 
 @router.get("/schedules", response_model=List[ScheduleResponse])
-async def list_schedules(_=Depends(require_bearer)):
+def list_schedules(_=Depends(require_bearer)):
     """Get all schedules for the current user"""
     schedules = _load_all_schedules()
 
@@ -363,7 +363,7 @@ async def resume_all_schedules(_=Depends(require_bearer)):
 # ========================
 
 @router.get("/executions", response_model=List[ExecutionResponse])
-async def list_executions(
+def list_executions(
     limit: int = 20,
     schedule_id: Optional[str] = None,
     _=Depends(require_bearer)
@@ -378,14 +378,14 @@ async def list_executions(
 # ========================
 
 @router.get("/pending-approvals", response_model=List[ApprovalResponse])
-async def list_pending_approvals(_=Depends(require_bearer)):
+def list_pending_approvals(_=Depends(require_bearer)):
     """Get all pending trade approvals"""
     approvals = _load_pending_approvals()
     return approvals
 
 
 @router.post("/approvals/{approval_id}/approve")
-async def approve_trade(
+def approve_trade(
     approval_id: str,
     _=Depends(require_bearer)
 ):
@@ -395,21 +395,22 @@ async def approve_trade(
     if not approval_file.exists():
         raise HTTPException(status_code=404, detail="Approval not found")
 
-    with open(approval_file, 'r') as f:
-        approval = json.load(f)
+    with open(approval_file, 'rb') as f:
+        approval = orjson.loads(f.read())
 
     if approval['status'] != 'pending':
         raise HTTPException(status_code=400, detail="Approval already processed")
 
     # Check expiration
+    now = datetime.utcnow()
     expires_at = datetime.fromisoformat(approval['expires_at'])
-    if expires_at < datetime.utcnow():
+    if expires_at < now:
         raise HTTPException(status_code=400, detail="Approval has expired")
 
     # Update approval status
     _update_approval(approval_id, {
         'status': 'approved',
-        'approved_at': datetime.utcnow().isoformat()
+        'approved_at': now.isoformat()
     })
 
     # TODO: Execute the trade via trading engine
@@ -418,7 +419,7 @@ async def approve_trade(
 
 
 @router.post("/approvals/{approval_id}/reject")
-async def reject_trade(
+def reject_trade(
     approval_id: str,
     decision: ApprovalDecision,
     _=Depends(require_bearer)
@@ -429,8 +430,8 @@ async def reject_trade(
     if not approval_file.exists():
         raise HTTPException(status_code=404, detail="Approval not found")
 
-    with open(approval_file, 'r') as f:
-        approval = json.load(f)
+    with open(approval_file, 'rb') as f:
+        approval = orjson.loads(f.read())
 
     if approval['status'] != 'pending':
         raise HTTPException(status_code=400, detail="Approval already processed")
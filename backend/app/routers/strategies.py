@@ -8,7 +8,9 @@ from pydantic import BaseModel
 from typing import Dict, Optional, List
 import json
 import os
+import time
 from pathlib import Path
+from threading import Lock
 
 from ..core.auth import require_bearer
 import sys
@@ -25,10 +27,32 @@ from strategies.under4_multileg import (
 
 router = APIRouter()
 
+# Strategy type -> config model + factory; one lookup instead of per-endpoint if/else
+STRATEGY_REGISTRY = {
+    "under4-multileg": {
+        "config": Under4MultilegConfig,
+        "factory": create_under4_multileg_strategy,
+    },
+}
+
 # Strategy storage path
 STRATEGIES_DIR = Path("data/strategies")
 STRATEGIES_DIR.mkdir(parents=True, exist_ok=True)
 
+# Short-lived cache for /strategies/list so dashboard polling doesn't glob and
+# re-read every saved config; save/delete invalidate it. The generation stops
+# a list built before an invalidation from being stored after it
+STRATEGIES_LIST_TTL = 5
+_strategies_cache = {"t": 0.0, "v": None, "gen": 0}
+_strategies_cache_lock = Lock()
+
+
+def _invalidate_strategies_cache():
+    with _strategies_cache_lock:
+        _strategies_cache["gen"] += 1
+        _strategies_cache["t"] = 0.0
+        _strategies_cache["v"] = None
+
 
 class StrategyConfigRequest(BaseModel):
     """Request model for saving strategy configuration"""
@@ -43,7 +67,7 @@ class StrategyRunRequest(BaseModel):
 
 
 @router.post("/strategies/save")
-async def save_strategy(
+def save_strategy(
     request: StrategyConfigRequest,
     _=Depends(require_bearer)
 ):
@@ -61,22 +85,24 @@ async def save_strategy(
 
     try:
         # Validate config based on strategy type
-        if request.strategy_type == "under4-multileg":
-            # Validate against Pydantic model
-            config = Under4MultilegConfig(**request.config)
-            validated_config = config.model_dump()
-        else:
+        strategy = STRATEGY_REGISTRY.get(request.strategy_type)
+        if strategy is None:
             raise HTTPException(
                 status_code=400,
                 detail=f"Unknown strategy type: {request.strategy_type}"
             )
 
+        # Validate against Pydantic model
+        config = strategy["config"](**request.config)
+        validated_config = config.model_dump()
+
         # Save to file
         with open(strategy_file, 'w') as f:
             json.dump({
                 "strategy_type": request.strategy_type,
                 "config": validated_config
             }, f, indent=2)
+        _invalidate_strategies_cache()
 
         return {
             "success": True,
@@ -88,7 +114,7 @@ async def save_strategy(
 
 
 @router.get("/strategies/load/{strategy_type}")
-async def load_strategy(
+def load_strategy(
     strategy_type: str,
     _=Depends(require_bearer)
 ):
@@ -102,19 +128,20 @@ async def load_strategy(
 
     if not strategy_file.exists():
         # Return default configuration
-        if strategy_type == "under4-multileg":
-            default_config = Under4MultilegConfig()
-            return {
-                "strategy_type": strategy_type,
-                "config": default_config.model_dump(),
-                "is_default": True
-            }
-        else:
+        strategy = STRATEGY_REGISTRY.get(strategy_type)
+        if strategy is None:
             raise HTTPException(
                 status_code=404,
                 detail=f"Strategy '{strategy_type}' not found"
             )
 
+        default_config = strategy["config"]()
+        return {
+            "strategy_type": strategy_type,
+            "config": default_config.model_dump(),
+            "is_default": True
+        }
+
     try:
         with open(strategy_file, 'r') as f:
             data = json.load(f)
@@ -129,12 +156,18 @@ async def load_strategy(
 
 
 @router.get("/strategies/list")
-async def list_strategies(_=Depends(require_bearer)):
+def list_strategies(_=Depends(require_bearer)):
     """
     List all available strategies
 
     GET /api/strategies/list
     """
+    now = time.time()
+    with _strategies_cache_lock:
+        if _strategies_cache["v"] is not None and now - _strategies_cache["t"] < STRATEGIES_LIST_TTL:
+            return _strategies_cache["v"]
+        generation = _strategies_cache["gen"]
+
     user_id = "default"  # TODO: Get from auth
 
     strategies = []
@@ -152,21 +185,28 @@ async def list_strategies(_=Depends(require_bearer)):
             continue
 
     # Add available strategies that haven't been configured
+    configured = {s["strategy_type"] for s in strategies}
     available_strategies = ["under4-multileg", "custom"]
     for strategy_type in available_strategies:
-        if not any(s["strategy_type"] == strategy_type for s in strategies):
+        if strategy_type not in configured:
             strategies.append({
                 "strategy_type": strategy_type,
                 "has_config": False
             })
 
-    return {
+    result = {
         "strategies": strategies
     }
+    with _strategies_cache_lock:
+        # A save/delete landed while we were globbing - don't cache a stale list
+        if _strategies_cache["gen"] == generation:
+            _strategies_cache["t"] = now
+            _strategies_cache["v"] = result
+    return result
 
 
 @router.post("/strategies/run")
-async def run_strategy(
+def run_strategy(
     request: StrategyRunRequest,
     _=Depends(require_bearer)
 ):
@@ -193,13 +233,13 @@ async def run_strategy(
             config_dict = None
 
         # Create strategy instance
-        if request.strategy_type == "under4-multileg":
-            strategy = create_under4_multileg_strategy(config_dict)
-        else:
+        registered = STRATEGY_REGISTRY.get(request.strategy_type)
+        if registered is None:
             raise HTTPException(
                 status_code=400,
                 detail=f"Unknown strategy type: {request.strategy_type}"
             )
+        strategy = registered["factory"](config_dict)
 
         # TODO: Get Alpaca client from user's credentials
         # For now, return mock results
@@ -244,7 +284,7 @@ async def run_strategy(
 
 
 @router.delete("/strategies/{strategy_type}")
-async def delete_strategy(
+def delete_strategy(
     strategy_type: str,
     _=Depends(require_bearer)
 ):
@@ -264,6 +304,7 @@ async def delete_strategy(
 
     try:
         strategy_file.unlink()
+        _invalidate_strategies_cache()
         return {
             "success": True,
             "message": f"Strategy '{strategy_type}' deleted successfully"
@@ -1,30 +1,83 @@
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from typing import Optional, Set
 import asyncio
-import json
+import orjson
 import time
 
 router = APIRouter()
 
+# Connected clients share one ticker task, so each tick is serialized once
+# and fanned out instead of re-encoded per socket
+_clients: Set[WebSocket] = set()
+_broadcast_task: Optional[asyncio.Task] = None
+
+_SNAPSHOT = {
+    "type": "market",
+    "symbol": "AAPL",
+    "price": 184.10
+}
+
+
+# A client that can't take a tick within this window is dropped, so one slow
+# socket never holds up the broadcast for everyone else
+_SEND_TIMEOUT = 1.0
+
+
+async def _send_or_drop(client: WebSocket, payload: str):
+    """Send one tick, closing and forgetting the client if it is slow or gone"""
+    try:
+        await asyncio.wait_for(client.send_text(payload), _SEND_TIMEOUT)
+    except Exception:
+        _clients.discard(client)
+        try:
+            await asyncio.wait_for(client.close(code=1013), _SEND_TIMEOUT)
+        except Exception:
+            pass
+
+
+async def _broadcast_ticks():
+    """Send one compact tick per second to every connected client"""
+    while _clients:
+        await asyncio.sleep(1)
+        # Demo tick - only the fields that moved
+        payload = orjson.dumps({
+            "type": "tick",
+            "price": _SNAPSHOT["price"],
+            "ts": time.time()
+        }).decode()
+        await asyncio.gather(*[_send_or_drop(client, payload) for client in list(_clients)])
+
+
 @router.websocket("/ws")
 async def ws_endpoint(ws: WebSocket):
     """
     Demo ticker for Render/Fly deployment.
 
+    The first message is a full "market" snapshot; every following message is
+    a compact "tick" carrying only the fields that change between updates, so
+    clients patch their existing state instead of re-reading the snapshot.
+
     Note: Vercel Functions can't be WebSocket servers.
     For Vercel-only deployments, use SSE (Server-Sent Events) instead:
     GET /stream with text/event-stream content-type.
     """
+    global _broadcast_task
     await ws.accept()
     try:
+        # Full snapshot on subscribe
+        await ws.send_text(orjson.dumps({**_SNAPSHOT, "ts": time.time()}).decode())
+
+        _clients.add(ws)
+        if _broadcast_task is None or _broadcast_task.done():
+            _broadcast_task = asyncio.create_task(_broadcast_ticks())
+
+        # Ticks arrive from the broadcaster; just wait here for the client to
+        # leave. receive() accepts text and binary frames alike
         while True:
-            # Demo tick
-            msg = {
-                "type": "market",
-                "symbol": "AAPL",
-                "price": 184.10,
-                "ts": time.time()
-            }
-            await ws.send_text(json.dumps(msg))
-            await asyncio.sleep(1)
+            message = await ws.receive()
+            if message["type"] == "websocket.disconnect":
+                break
     except WebSocketDisconnect:
-        pass
\ No newline at end of file
+        pass
+    finally:
+        _clients.discard(ws)
@@ -5,8 +5,9 @@ from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 from typing import List, Dict, Any, Literal, Optional
 from datetime import datetime
-from collections import defaultdict
-import json
+from collections import Counter
+import heapq
+import orjson
 import os
 
 router = APIRouter(prefix="/api/telemetry", tags=["telemetry"])
@@ -14,6 +15,23 @@ router = APIRouter(prefix="/api/telemetry", tags=["telemetry"])
 # In-memory storage (replace with database in production)
 telemetry_events: List[Dict[str, Any]] = []
 
+# Running aggregates, updated as events arrive so /stats never rescans the log
+component_counts: Counter = Counter()
+action_counts: Counter = Counter()
+role_counts: Counter = Counter()
+unique_users: set = set()
+unique_sessions: set = set()
+
+
+def _record_event(event_dict: Dict[str, Any]):
+    """Store an event and fold it into the running aggregates"""
+    telemetry_events.append(event_dict)
+    unique_users.add(event_dict.get('userId'))
+    unique_sessions.add(event_dict.get('sessionId'))
+    component_counts[event_dict.get('component', 'Unknown')] += 1
+    action_counts[event_dict.get('action', 'Unknown')] += 1
+    role_counts[event_dict.get('userRole', 'unknown')] += 1
+
 
 class TelemetryEvent(BaseModel):
     userId: str
@@ -36,15 +54,14 @@ async def log_telemetry(batch: TelemetryBatch):
     """
     try:
         # Store events
-        for event in batch.events:
-            event_dict = event.dict()
-            telemetry_events.append(event_dict)
+        events = [event.dict() for event in batch.events]
+        for event_dict in events:
+            _record_event(event_dict)
 
-        # Optional: Write to file for persistence
+        # Optional: Write to file for persistence - one buffered write per batch
         log_file = "telemetry_events.jsonl"
-        with open(log_file, "a") as f:
-            for event in batch.events:
-                f.write(json.dumps(event.dict()) + "\n")
+        with open(log_file, "ab") as f:
+            f.write(b"".join(orjson.dumps(event_dict) + b"\n" for event_dict in events))
 
         return {
             "success": True,
@@ -78,12 +95,11 @@ async def get_telemetry_events(
     if user_role:
         filtered_events = [e for e in filtered_events if e.get('userRole') == user_role]
 
-    # Sort by timestamp (newest first)
-    filtered_events.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
-
+    # Newest first; only the top `limit` need ordering, and the shared
+    # telemetry_events list is left untouched
     return {
         "total": len(filtered_events),
-        "events": filtered_events[:limit]
+        "events": heapq.nlargest(limit, filtered_events, key=lambda x: x.get('timestamp', ''))
     }
 
 
@@ -102,30 +118,9 @@ async def get_telemetry_stats():
             "users_by_role": {}
         }
 
-    unique_users = set(e.get('userId') for e in telemetry_events)
-    unique_sessions = set(e.get('sessionId') for e in telemetry_events)
-
-    # Count by component
-    component_counts = {}
-    for event in telemetry_events:
-        comp = event.get('component', 'Unknown')
-        component_counts[comp] = component_counts.get(comp, 0) + 1
-
-    # Count by action
-    action_counts = {}
-    for event in telemetry_events:
-        action = event.get('action', 'Unknown')
-        action_counts[action] = action_counts.get(action, 0) + 1
-
-    # Count by role
-    role_counts = {}
-    for event in telemetry_events:
-        role = event.get('userRole', 'unknown')
-        role_counts[role] = role_counts.get(role, 0) + 1
-
-    # Sort and get top 10
-    top_components = sorted(component_counts.items(), key=lambda x: x[1], reverse=True)[:10]
-    top_actions = sorted(action_counts.items(), key=lambda x: x[1], reverse=True)[:10]
+    # Top 10 by count
+    top_components = component_counts.most_common(10)
+    top_actions = action_counts.most_common(10)
 
     return {
         "total_events": len(telemetry_events),
@@ -133,7 +128,7 @@ async def get_telemetry_stats():
         "unique_sessions": len(unique_sessions),
         "top_components": [{"component": c, "count": n} for c, n in top_components],
         "top_actions": [{"action": a, "count": n} for a, n in top_actions],
-        "users_by_role": role_counts
+        "users_by_role": dict(role_counts)
     }
 
 
@@ -145,6 +140,11 @@ async def clear_telemetry_events():
     global telemetry_events
     count = len(telemetry_events)
     telemetry_events = []
+    component_counts.clear()
+    action_counts.clear()
+    role_counts.clear()
+    unique_users.clear()
+    unique_sessions.clear()
 
     return {
         "success": True,
@@ -9,7 +9,7 @@ from datetime import datetime, timedelta
 from typing import Dict, Optional, Any, List
 import logging
 import asyncio
-import json
+import orjson
 from pathlib import Path
 import uuid
 
@@ -26,6 +26,27 @@ EXECUTIONS_DIR.mkdir(parents=True, exist_ok=True)
 APPROVALS_DIR.mkdir(parents=True, exist_ok=True)
 
 
+# Mock morning-routine output. A literal that is only read, so it lives at
+# module scope instead of being rebuilt on every execution.
+MOCK_MORNING_RECOMMENDATIONS = [
+    {
+        'action': 'buy',
+        'symbol': 'AAPL',
+        'quantity': 10,
+        'price': 150.0,
+        'value': 1500.0,
+        'reason': 'Strong technical breakout with positive news sentiment',
+        'risk_score': 3,
+        'confidence': 0.85,
+        'supporting_data': {
+            'technical_signals': ['RSI oversold', 'MACD bullish crossover'],
+            'news_sentiment': 0.7,
+            'volatility': 0.2
+        }
+    }
+]
+
+
 class TradingScheduler:
     """Main scheduler service for automated trading operations"""
 
@@ -59,8 +80,8 @@ class TradingScheduler:
         """Restore all enabled schedules from storage"""
         try:
             for schedule_file in SCHEDULES_DIR.glob("*.json"):
-                with open(schedule_file, 'r') as f:
-                    schedule = json.load(f)
+                with open(schedule_file, 'rb') as f:
+                    schedule = orjson.loads(f.read())
                     if schedule.get('enabled', False):
                         asyncio.create_task(self.add_schedule(
                             schedule_id=schedule['id'],
@@ -186,54 +207,39 @@ class TradingScheduler:
     # Execution Functions
     # ========================
 
-    async def _execute_morning_routine(self, schedule_id: str, requires_approval: bool):
-        """Execute morning routine workflow"""
-        execution_id = await self._create_execution_record(schedule_id, 'morning_routine')
+    async def _run_execution(self, schedule_id: str, execution_type: str, label: str, run):
+        """Record an execution around `run(execution_id)`, which returns the result text"""
+        execution_id = await self._create_execution_record(schedule_id, execution_type)
+        title = label[:1].upper() + label[1:]
 
         try:
-            logger.info(f"Executing morning routine for schedule {schedule_id}")
-
-            # Generate mock recommendations for testing
-            recommendations = [
-                {
-                    'action': 'buy',
-                    'symbol': 'AAPL',
-                    'quantity': 10,
-                    'price': 150.0,
-                    'value': 1500.0,
-                    'reason': 'Strong technical breakout with positive news sentiment',
-                    'risk_score': 3,
-                    'confidence': 0.85,
-                    'supporting_data': {
-                        'technical_signals': ['RSI oversold', 'MACD bullish crossover'],
-                        'news_sentiment': 0.7,
-                        'volatility': 0.2
-                    }
-                }
-            ]
+            logger.info(f"Executing {label} for schedule {schedule_id}")
+            result = await run(execution_id)
+            await self._complete_execution(execution_id, 'completed', result)
+            logger.info(f"{title} completed for schedule {schedule_id}")
+
+        except Exception as e:
+            logger.error(f"{title} failed for schedule {schedule_id}: {str(e)}")
+            await self._complete_execution(execution_id, 'failed', None, str(e))
+
+    async def _execute_morning_routine(self, schedule_id: str, requires_approval: bool):
+        """Execute morning routine workflow"""
+        async def run(execution_id: str) -> str:
+            # Mock recommendations for testing (read-only, shared across runs)
+            recommendations = MOCK_MORNING_RECOMMENDATIONS
 
             if requires_approval and recommendations:
                 await self._create_approval_requests(
                     execution_id, recommendations, schedule_id
                 )
-                result = f"Generated {len(recommendations)} recommendations pending approval"
-            else:
-                result = f"Executed {len(recommendations)} trades automatically"
+                return f"Generated {len(recommendations)} recommendations pending approval"
+            return f"Executed {len(recommendations)} trades automatically"
 
-            await self._complete_execution(execution_id, 'completed', result)
-            logger.info(f"Morning routine completed for schedule {schedule_id}")
-
-        except Exception as e:
-            logger.error(f"Morning routine failed for schedule {schedule_id}: {str(e)}")
-            await self._complete_execution(execution_id, 'failed', None, str(e))
+        await self._run_execution(schedule_id, 'morning_routine', 'morning routine', run)
 
     async def _execute_news_review(self, schedule_id: str, requires_approval: bool):
         """Execute news review workflow"""
-        execution_id = await self._create_execution_record(schedule_id, 'news_review')
-
-        try:
-            logger.info(f"Executing news review for schedule {schedule_id}")
-
+        async def run(execution_id: str) -> str:
             # Mock news-based signals
             signals = []
 
@@ -241,23 +247,14 @@ class TradingScheduler:
                 await self._create_approval_requests(
                     execution_id, signals, schedule_id
                 )
-                result = f"Generated {len(signals)} signals pending approval"
-            else:
-                result = f"No actionable news signals found"
+                return f"Generated {len(signals)} signals pending approval"
+            return "No actionable news signals found"
 
-            await self._complete_execution(execution_id, 'completed', result)
-
-        except Exception as e:
-            logger.error(f"News review failed for schedule {schedule_id}: {str(e)}")
-            await self._complete_execution(execution_id, 'failed', None, str(e))
+        await self._run_execution(schedule_id, 'news_review', 'news review', run)
 
     async def _execute_ai_recommendations(self, schedule_id: str, requires_approval: bool):
         """Execute AI recommendations check"""
-        execution_id = await self._create_execution_record(schedule_id, 'ai_recs')
-
-        try:
-            logger.info(f"Executing AI recommendations for schedule {schedule_id}")
-
+        async def run(execution_id: str) -> str:
             # Mock AI recommendations
             recommendations = []
 
@@ -265,44 +262,35 @@ class TradingScheduler:
                 await self._create_approval_requests(
                     execution_id, recommendations, schedule_id
                 )
-                result = f"Generated {len(recommendations)} high-confidence recs pending approval"
-            else:
-                result = f"No high-confidence recommendations at this time"
-
-            await self._complete_execution(execution_id, 'completed', result)
+                return f"Generated {len(recommendations)} high-confidence recs pending approval"
+            return "No high-confidence recommendations at this time"
 
-        except Exception as e:
-            logger.error(f"AI recommendations failed for schedule {schedule_id}: {str(e)}")
-            await self._complete_execution(execution_id, 'failed', None, str(e))
+        await self._run_execution(schedule_id, 'ai_recs', 'AI recommendations', run)
 
     async def _execute_custom_action(self, schedule_id: str, requires_approval: bool):
         """Execute custom scheduled action"""
-        execution_id = await self._create_execution_record(schedule_id, 'custom')
+        async def run(execution_id: str) -> str:
+            return "Custom action completed"
 
-        try:
-            logger.info(f"Executing custom action for schedule {schedule_id}")
-            result = "Custom action completed"
-            await self._complete_execution(execution_id, 'completed', result)
-
-        except Exception as e:
-            logger.error(f"Custom action failed for schedule {schedule_id}: {str(e)}")
-            await self._complete_execution(execution_id, 'failed', None, str(e))
+        await self._run_execution(schedule_id, 'custom', 'custom action', run)
 
     # ========================
     # Helper Functions
     # ========================
 
+    def _load_schedule_name(self, schedule_id: str) -> str:
+        """Read a schedule's display name from file storage"""
+        schedule_file = SCHEDULES_DIR / f"{schedule_id}.json"
+        if not schedule_file.exists():
+            return "Unknown"
+        with open(schedule_file, 'rb') as f:
+            return orjson.loads(f.read()).get('name', 'Unknown')
+
     async def _create_execution_record(self, schedule_id: str, execution_type: str) -> str:
         """Create execution record in file storage"""
         execution_id = str(uuid.uuid4())
 
-        # Load schedule info
-        schedule_file = SCHEDULES_DIR / f"{schedule_id}.json"
-        schedule_name = "Unknown"
-        if schedule_file.exists():
-            with open(schedule_file, 'r') as f:
-                schedule = json.load(f)
-                schedule_name = schedule.get('name', 'Unknown')
+        schedule_name = self._load_schedule_name(schedule_id)
 
         execution = {
             'id': execution_id,
@@ -316,8 +304,8 @@ class TradingScheduler:
             'error': None
         }
 
-        with open(EXECUTIONS_DIR / f"{execution_id}.json", 'w') as f:
-            json.dump(execution, f, indent=2)
+        with open(EXECUTIONS_DIR / f"{execution_id}.json", 'wb') as f:
+            f.write(orjson.dumps(execution, option=orjson.OPT_INDENT_2))
 
         return execution_id
 
@@ -332,8 +320,8 @@ class TradingScheduler:
         execution_file = EXECUTIONS_DIR / f"{execution_id}.json"
 
         if execution_file.exists():
-            with open(execution_file, 'r') as f:
-                execution = json.load(f)
+            with open(execution_file, 'rb') as f:
+                execution = orjson.loads(f.read())
 
             execution.update({
                 'status': status,
@@ -342,8 +330,8 @@ class TradingScheduler:
                 'error': error
             })
 
-            with open(execution_file, 'w') as f:
-                json.dump(execution, f, indent=2)
+            with open(execution_file, 'wb') as f:
+                f.write(orjson.dumps(execution, option=orjson.OPT_INDENT_2))
 
     async def _create_approval_requests(
         self,
@@ -352,13 +340,12 @@ class TradingScheduler:
         schedule_id: str
     ):
         """Create approval requests for trades"""
-        # Load schedule info
-        schedule_file = SCHEDULES_DIR / f"{schedule_id}.json"
-        schedule_name = "Unknown"
-        if schedule_file.exists():
-            with open(schedule_file, 'r') as f:
-                schedule = json.load(f)
-                schedule_name = schedule.get('name', 'Unknown')
+        schedule_name = self._load_schedule_name(schedule_id)
+
+        # One timestamp for the whole batch
+        now = datetime.utcnow()
+        created_at = now.isoformat()
+        expires_at = (now + timedelta(hours=4)).isoformat()
 
         for rec in recommendations:
             approval_id = str(uuid.uuid4())
@@ -377,15 +364,15 @@ class TradingScheduler:
                 'ai_confidence': rec.get('confidence', 0.5) * 100,
                 'supporting_data': rec.get('supporting_data', {}),
                 'status': 'pending',
-                'created_at': datetime.utcnow().isoformat(),
-                'expires_at': (datetime.utcnow() + timedelta(hours=4)).isoformat(),
+                'created_at': created_at,
+                'expires_at': expires_at,
                 'approved_at': None,
                 'approved_by': None,
                 'rejection_reason': None
             }
 
-            with open(APPROVALS_DIR / f"{approval_id}.json", 'w') as f:
-                json.dump(approval, f, indent=2)
+            with open(APPROVALS_DIR / f"{approval_id}.json", 'wb') as f:
+                f.write(orjson.dumps(approval, option=orjson.OPT_INDENT_2))
 
 
 # Global scheduler instance
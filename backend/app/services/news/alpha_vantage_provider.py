@@ -2,7 +2,7 @@ import os
 import requests
 from datetime import datetime
 from typing import List
-from .base_provider import BaseNewsProvider, NewsArticle
+from .base_provider import BaseNewsProvider, NewsArticle, url_id
 
 class AlphaVantageProvider(BaseNewsProvider):
     def __init__(self):
@@ -10,6 +10,8 @@ class AlphaVantageProvider(BaseNewsProvider):
         if not self.api_key:
             raise ValueError("ALPHA_VANTAGE_API_KEY not set")
         self.provider_name = 'alpha_vantage'
+        # Reused across calls so repeat fetches skip the TCP/TLS handshake
+        self.session = requests.Session()
 
     def get_company_news(self, symbol: str, days_back: int = 7) -> List[NewsArticle]:
         url = "https://www.alphavantage.co/query"
@@ -21,7 +23,7 @@ class AlphaVantageProvider(BaseNewsProvider):
         }
 
         try:
-            response = requests.get(url, params=params, timeout=10)
+            response = self.session.get(url, params=params, timeout=10)
             data = response.json()
 
             if 'feed' not in data:
@@ -43,7 +45,7 @@ class AlphaVantageProvider(BaseNewsProvider):
         }
 
         try:
-            response = requests.get(url, params=params, timeout=10)
+            response = self.session.get(url, params=params, timeout=10)
             data = response.json()
 
             if 'feed' not in data:
@@ -59,7 +61,7 @@ class AlphaVantageProvider(BaseNewsProvider):
         sentiment_score = float(article.get('overall_sentiment_score', 0))
 
         return NewsArticle(
-            id=f"alphavantage_{hash(article['url'])}",
+            id=f"alphavantage_{url_id(article['url'])}",
             title=article['title'],
             summary=article.get('summary', ''),
             source=article.get('source', 'Unknown'),
@@ -1,9 +1,22 @@
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any
 from datetime import datetime
+import hashlib
+
+
+def url_id(url: str) -> str:
+    """Stable short id for an article URL (builtin hash() is salted per process)"""
+    return hashlib.blake2b(url.encode(), digest_size=8).hexdigest()
+
 
 class NewsArticle:
     """Standardized news article format"""
+    # Hundreds are built per aggregation; slots skip the per-instance __dict__
+    __slots__ = (
+        'id', 'title', 'summary', 'source', 'url', 'published_at', 'sentiment',
+        'sentiment_score', 'symbols', 'category', 'image_url', 'provider'
+    )
+
     def __init__(self, **kwargs):
         self.id = kwargs.get('id')
         self.title = kwargs.get('title')
@@ -2,7 +2,7 @@ import finnhub
 import os
 from datetime import datetime, timedelta
 from typing import List
-from .base_provider import BaseNewsProvider, NewsArticle
+from .base_provider import BaseNewsProvider, NewsArticle, url_id
 
 class FinnhubProvider(BaseNewsProvider):
     def __init__(self):
@@ -13,8 +13,9 @@ class FinnhubProvider(BaseNewsProvider):
         self.provider_name = 'finnhub'
 
     def get_company_news(self, symbol: str, days_back: int = 7) -> List[NewsArticle]:
-        to_date = datetime.now().strftime('%Y-%m-%d')
-        from_date = (datetime.now() - timedelta(days=days_back)).strftime('%Y-%m-%d')
+        now = datetime.now()
+        to_date = now.strftime('%Y-%m-%d')
+        from_date = (now - timedelta(days=days_back)).strftime('%Y-%m-%d')
 
         try:
             news = self.client.company_news(symbol.upper(), _from=from_date, to=to_date)
@@ -33,7 +34,7 @@ class FinnhubProvider(BaseNewsProvider):
 
     def _transform_article(self, article: dict, symbol: str = None) -> NewsArticle:
         return NewsArticle(
-            id=f"finnhub_{article.get('id', hash(article['url']))}",
+            id=f"finnhub_{article['id'] if 'id' in article else url_id(article['url'])}",
             title=article['headline'],
             summary=article.get('summary', ''),
             source=article['source'],
@@ -1,5 +1,8 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from threading import Lock
+import time
 from collections import defaultdict
 from difflib import SequenceMatcher
 
@@ -8,9 +11,36 @@ from .alpha_vantage_provider import AlphaVantageProvider
 from .polygon_provider import PolygonProvider
 from .base_provider import NewsArticle
 
+# Aggregated results are reused for this long before hitting the providers again
+NEWS_CACHE_TTL = 60  # seconds
+NEWS_CACHE_MAX_KEYS = 256
+
+
+def _priority_score(article: NewsArticle, now: datetime) -> float:
+    """Importance score used by NewsAggregator._prioritize"""
+    score = 0.0
+
+    try:
+        age_hours = (now - datetime.fromisoformat(article.published_at.replace('Z', '+00:00'))).total_seconds() / 3600
+        score += max(0, 100 - age_hours)
+    except:
+        pass
+
+    score += abs(article.sentiment_score) * 50
+
+    if ',' in article.provider:
+        score += 30
+
+    score += min(len(article.summary) / 10, 20)
+
+    return score
+
+
 class NewsAggregator:
     def __init__(self):
         self.providers = []
+        self._cache: Dict[tuple, tuple] = {}
+        self._cache_lock = Lock()
 
         # Try to initialize each provider (fail gracefully if API key missing)
         try:
@@ -34,17 +64,44 @@ class NewsAggregator:
         if not self.providers:
             raise ValueError("No news providers available - check API keys!")
 
-    def get_company_news(self, symbol: str, days_back: int = 7) -> List[Dict[str, Any]]:
-        """Aggregate news from all providers for a specific company"""
-        all_articles = []
-
-        for provider in self.providers:
+    def _get_cached(self, key: tuple) -> Optional[List[Dict[str, Any]]]:
+        with self._cache_lock:
+            hit = self._cache.get(key)
+        if hit and time.monotonic() - hit[0] < NEWS_CACHE_TTL:
+            return hit[1]
+        return None
+
+    def _set_cached(self, key: tuple, value: List[Dict[str, Any]]) -> None:
+        now = time.monotonic()
+        with self._cache_lock:
+            if len(self._cache) >= NEWS_CACHE_MAX_KEYS:
+                self._cache = {k: v for k, v in self._cache.items() if now - v[0] < NEWS_CACHE_TTL}
+            self._cache[key] = (now, value)
+
+    def _fetch_from_providers(self, fetch: Callable[[Any], List[NewsArticle]]) -> List[NewsArticle]:
+        """Query all providers concurrently; results keep provider order"""
+        def run(provider) -> List[NewsArticle]:
             try:
-                articles = provider.get_company_news(symbol, days_back)
-                all_articles.extend(articles)
+                articles = fetch(provider)
                 print(f"[OK] {provider.get_provider_name()}: {len(articles)} articles")
+                return articles
             except Exception as e:
                 print(f"[ERROR] {provider.get_provider_name()} failed: {e}")
+                return []
+
+        with ThreadPoolExecutor(max_workers=len(self.providers)) as pool:
+            results = list(pool.map(run, self.providers))
+
+        return [article for articles in results for article in articles]
+
+    def get_company_news(self, symbol: str, days_back: int = 7) -> List[Dict[str, Any]]:
+        """Aggregate news from all providers for a specific company"""
+        key = ("company", symbol.upper(), days_back)
+        cached = self._get_cached(key)
+        if cached is not None:
+            return cached
+
+        all_articles = self._fetch_from_providers(lambda provider: provider.get_company_news(symbol, days_back))
 
         # Deduplicate
         deduplicated = self._deduplicate(all_articles)
@@ -57,19 +114,19 @@ class NewsAggregator:
 
         print(f"[NEWS] Total: {len(all_articles)} articles -> {len(aggregated)} unique")
 
-        return [article.to_dict() for article in aggregated]
+        result = [article.to_dict() for article in aggregated]
+        self._set_cached(key, result)
+        return result
 
     def get_market_news(self, category: str = 'general', limit: int = 50) -> List[Dict[str, Any]]:
         """Aggregate market news from all providers"""
-        all_articles = []
+        # Cache the full prioritized list so any limit can be served from it
+        key = ("market", category)
+        cached = self._get_cached(key)
+        if cached is not None:
+            return cached[:limit]
 
-        for provider in self.providers:
-            try:
-                articles = provider.get_market_news(category)
-                all_articles.extend(articles)
-                print(f"[OK] {provider.get_provider_name()}: {len(articles)} articles")
-            except Exception as e:
-                print(f"[ERROR] {provider.get_provider_name()} failed: {e}")
+        all_articles = self._fetch_from_providers(lambda provider: provider.get_market_news(category))
 
         # Deduplicate
         deduplicated = self._deduplicate(all_articles)
@@ -82,7 +139,9 @@ class NewsAggregator:
 
         print(f"[NEWS] Total: {len(all_articles)} articles -> {len(aggregated)} unique")
 
-        return [article.to_dict() for article in aggregated[:limit]]
+        result = [article.to_dict() for article in aggregated]
+        self._set_cached(key, result)
+        return result[:limit]
 
     def _deduplicate(self, articles: List[NewsArticle]) -> List[NewsArticle]:
         """Remove duplicate articles based on title similarity"""
@@ -91,6 +150,7 @@ class NewsAggregator:
 
         groups = []
         used = set()
+        titles = [article.title.lower() for article in articles]
 
         for i, article in enumerate(articles):
             if i in used:
@@ -99,14 +159,17 @@ class NewsAggregator:
             group = [article]
             used.add(i)
 
-            for j, other in enumerate(articles[i+1:], start=i+1):
+            for j in range(i + 1, len(articles)):
                 if j in used:
                     continue
 
-                similarity = SequenceMatcher(None, article.title.lower(), other.title.lower()).ratio()
-
-                if similarity > 0.85:
-                    group.append(other)
+                # real_quick_ratio/quick_ratio are cheap upper bounds on ratio();
+                # most pairs are unrelated headlines and fail them outright
+                matcher = SequenceMatcher(None, titles[i], titles[j])
+                if (matcher.real_quick_ratio() > 0.85
+                        and matcher.quick_ratio() > 0.85
+                        and matcher.ratio() > 0.85):
+                    group.append(articles[j])
                     used.add(j)
 
             groups.append(group)
@@ -133,11 +196,19 @@ class NewsAggregator:
             if len(group) == 1:
                 aggregated.append(group[0])
             else:
-                avg_score = sum(a.sentiment_score for a in group) / len(group)
-                best = max(group, key=lambda x: len(x.summary))
+                # One pass for score total, longest summary and provider names
+                total_score = 0.0
+                best = group[0]
+                providers = {}
+                for a in group:
+                    total_score += a.sentiment_score
+                    if len(a.summary) > len(best.summary):
+                        best = a
+                    providers[a.provider] = None
+                avg_score = total_score / len(group)
                 best.sentiment_score = avg_score
                 best.sentiment = self._score_to_label(avg_score)
-                best.provider = ', '.join(set(a.provider for a in group))
+                best.provider = ', '.join(providers)
                 aggregated.append(best)
 
         return aggregated
@@ -152,23 +223,8 @@ class NewsAggregator:
 
     def _prioritize(self, articles: List[NewsArticle]) -> List[NewsArticle]:
         """Sort by importance"""
-        def priority_score(article: NewsArticle) -> float:
-            score = 0.0
-
-            try:
-                age_hours = (datetime.now() - datetime.fromisoformat(article.published_at.replace('Z', '+00:00'))).total_seconds() / 3600
-                score += max(0, 100 - age_hours)
-            except:
-                pass
-
-            score += abs(article.sentiment_score) * 50
-
-            if ',' in article.provider:
-                score += 30
-
-            score += min(len(article.summary) / 10, 20)
-
-            return score
+        # One clock read for the whole sort instead of one per article
+        now = datetime.now()
 
-        articles.sort(key=priority_score, reverse=True)
+        articles.sort(key=lambda article: _priority_score(article, now), reverse=True)
         return articles
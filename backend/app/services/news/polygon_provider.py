@@ -11,6 +11,8 @@ class PolygonProvider(BaseNewsProvider):
             raise ValueError("POLYGON_API_KEY not set")
         self.base_url = "https://api.polygon.io"
         self.provider_name = 'polygon'
+        # Reused across calls so repeat fetches skip the TCP/TLS handshake
+        self.session = requests.Session()
 
     def get_company_news(self, symbol: str, days_back: int = 7) -> List[NewsArticle]:
         url = f"{self.base_url}/v2/reference/news"
@@ -21,7 +23,7 @@ class PolygonProvider(BaseNewsProvider):
         }
 
         try:
-            response = requests.get(url, params=params, timeout=10)
+            response = self.session.get(url, params=params, timeout=10)
             data = response.json()
 
             if data.get('status') != 'OK':
@@ -41,7 +43,7 @@ class PolygonProvider(BaseNewsProvider):
         }
 
         try:
-            response = requests.get(url, params=params, timeout=10)
+            response = self.session.get(url, params=params, timeout=10)
             data = response.json()
 
             if data.get('status') != 'OK':
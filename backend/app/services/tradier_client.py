@@ -28,6 +28,10 @@ class TradierClient:
         if not self.api_key or not self.account_id:
             raise ValueError("TRADIER_API_KEY and TRADIER_ACCOUNT_ID must be set in .env")
 
+        # Reuse one pooled connection across requests instead of a fresh TLS handshake each call
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+
         logger.info(f"Tradier client initialized for account {self.account_id}")
 
     def _request(self, method: str, endpoint: str, **kwargs) -> Dict:
@@ -35,10 +39,9 @@ class TradierClient:
         url = f"{self.base_url}{endpoint}"
 
         try:
-            response = requests.request(
+            response = self.session.request(
                 method=method,
                 url=url,
-                headers=self.headers,
                 timeout=10,
                 **kwargs
             )
@@ -94,13 +97,14 @@ class TradierClient:
     def _normalize_position(self, pos: Dict) -> Dict:
         """Convert Tradier position to standard format"""
         quantity = float(pos.get("quantity", 0))
+        abs_quantity = abs(quantity)
         cost_basis = float(pos.get("cost_basis", 0))
 
         return {
             "symbol": pos.get("symbol"),
-            "qty": str(abs(quantity)),
+            "qty": str(abs_quantity),
             "side": "long" if quantity > 0 else "short",
-            "avg_entry_price": str(cost_basis / abs(quantity) if quantity != 0 else 0),
+            "avg_entry_price": str(cost_basis / abs_quantity if quantity != 0 else 0),
             "market_value": pos.get("market_value"),
             "cost_basis": str(cost_basis),
             "unrealized_pl": pos.get("unrealized_pl"),
@@ -1,6 +1,7 @@
-import requests
+import asyncio
+import httpx
 import os
-from datetime import datetime
+from datetime import datetime, timezone
 from dotenv import load_dotenv
 from pathlib import Path
 
@@ -15,6 +16,32 @@ headers = {
     "APCA-API-SECRET-KEY": APCA_API_SECRET_KEY
 }
 
+TRADE_URL = "https://data.alpaca.markets/v2/stocks/AAPL/trades/latest"
+ACCOUNT_URL = "https://paper-api.alpaca.markets/v2/account"
+symbols = ["TLRY", "PLUG", "BBD"]
+
+
+async def fetch_all():
+    """Issue every request at once; the checks below only read the results"""
+    # Unset keys are dropped (as requests did) so the checks report the 401/403
+    async with httpx.AsyncClient(headers={k: v for k, v in headers.items() if v}, timeout=10) as client:
+        return await asyncio.gather(
+            client.get(TRADE_URL),
+            client.get(ACCOUNT_URL),
+            *[client.get(f"https://data.alpaca.markets/v2/stocks/{symbol}/quotes/latest") for symbol in symbols],
+            return_exceptions=True
+        )
+
+
+def result(response):
+    """Re-raise a failed request inside the check that reports it"""
+    if isinstance(response, Exception):
+        raise response
+    return response
+
+
+trade_response, account_response, *quote_responses = asyncio.run(fetch_all())
+
 print("=" * 60)
 print("ALPACA DATA FRESHNESS & SUBSCRIPTION TEST")
 print("=" * 60)
@@ -23,14 +50,10 @@ print("=" * 60)
 print("\n[1] Testing Latest Trade Data for AAPL:")
 print("-" * 60)
 try:
-    response = requests.get(
-        "https://data.alpaca.markets/v2/stocks/AAPL/trades/latest",
-        headers=headers
-    )
+    response = result(trade_response)
     if response.status_code == 200:
         data = response.json()
         trade_time = datetime.fromisoformat(data['trade']['t'].replace('Z', '+00:00'))
-        from datetime import timezone
         current_time = datetime.now(timezone.utc)
         delay_minutes = (current_time - trade_time).total_seconds() / 60
 
@@ -56,10 +79,7 @@ except Exception as e:
 print("\n[2] Testing Account Subscription Level:")
 print("-" * 60)
 try:
-    response = requests.get(
-        "https://paper-api.alpaca.markets/v2/account",
-        headers=headers
-    )
+    response = result(account_response)
     if response.status_code == 200:
         account = response.json()
         print(f"[OK] Account Number: {account.get('account_number')}")
@@ -78,17 +98,12 @@ except Exception as e:
 # Test 3: Check latest quote for stocks under $4
 print("\n[3] Testing Latest Quotes for Stocks Under $4:")
 print("-" * 60)
-symbols = ["TLRY", "PLUG", "BBD"]
-for symbol in symbols:
+for symbol, quote_response in zip(symbols, quote_responses):
     try:
-        response = requests.get(
-            f"https://data.alpaca.markets/v2/stocks/{symbol}/quotes/latest",
-            headers=headers
-        )
+        response = result(quote_response)
         if response.status_code == 200:
             data = response.json()
             quote_time = datetime.fromisoformat(data['quote']['t'].replace('Z', '+00:00'))
-            from datetime import timezone
             current_time = datetime.now(timezone.utc)
             delay_minutes = (current_time - quote_time).total_seconds() / 60
 
@@ -0,0 +1,9 @@
+import pytest
+from fastapi.testclient import TestClient
+from app.main import app
+
+
+@pytest.fixture(scope="session")
+def client():
+    """One TestClient for the whole run instead of one per test module"""
+    return TestClient(app)
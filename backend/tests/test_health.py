@@ -1,7 +1,2 @@
-from fastapi.testclient import TestClient
-from app.main import app
-
-client = TestClient(app)
-
-def test_health():
-    assert client.get("/api/health").status_code == 200
\ No newline at end of file
+def test_health(client):
+    assert client.get("/api/health").status_code == 200
@@ -0,0 +1,32 @@
+from app.routers import strategies
+
+HEAD = {"Authorization": "Bearer change-me"}
+
+def test_saved_strategy_listed_immediately(client, monkeypatch, tmp_path):
+    monkeypatch.setattr(strategies, "STRATEGIES_DIR", tmp_path)
+    strategies._invalidate_strategies_cache()
+
+    # Prime the cache before the save
+    before = client.get("/api/strategies/list", headers=HEAD).json()["strategies"]
+    assert {"strategy_type": "under4-multileg", "has_config": False} in before
+
+    r = client.post("/api/strategies/save", json={"strategy_type": "under4-multileg", "config": {}}, headers=HEAD)
+    assert r.status_code == 200
+
+    after = client.get("/api/strategies/list", headers=HEAD).json()["strategies"]
+    assert {"strategy_type": "under4-multileg", "has_config": True} in after
+
+def test_list_built_before_invalidation_is_not_cached(monkeypatch, tmp_path):
+    monkeypatch.setattr(strategies, "STRATEGIES_DIR", tmp_path)
+    strategies._invalidate_strategies_cache()
+
+    # Simulate a save landing while the poll is globbing the directory
+    real_glob = type(tmp_path).glob
+    def glob_then_invalidate(self, pattern):
+        files = list(real_glob(self, pattern))
+        strategies._invalidate_strategies_cache()
+        return files
+    monkeypatch.setattr(type(tmp_path), "glob", glob_then_invalidate)
+
+    strategies.list_strategies()
+    assert strategies._strategies_cache["v"] is None
@@ -16,6 +16,33 @@ interface AIChatProps {
   onResponse?: (response: string) => void;
 }
 
+/**
+ * Single chat message. Memoized so typing in the input or appending a reply
+ * only renders what changed, not the whole history.
+ */
+const ChatBubble = React.memo(function ChatBubble({ role, content }: AIMessage) {
+  return (
+    <div className={`flex ${role === 'user' ? 'justify-end' : 'justify-start'}`}>
+      <div
+        className={`max-w-[80%] rounded-2xl px-4 py-3 ${
+          role === 'user'
+            ? 'bg-gradient-to-r from-blue-500 to-purple-600 text-white'
+            : 'bg-white/60 backdrop-blur-md border border-white/20 text-gray-800'
+        }`}
+        style={{
+          boxShadow: role === 'user'
+            ? '0 4px 12px rgba(99, 102, 241, 0.3)'
+            : '0 2px 8px rgba(0, 0, 0, 0.1)',
+        }}
+      >
+        <p className="text-sm leading-relaxed whitespace-pre-wrap">
+          {content}
+        </p>
+      </div>
+    </div>
+  );
+});
+
 export function AIChat({
   isOpen,
   onClose,
@@ -128,27 +155,7 @@ export function AIChat({
           {/* Messages */}
           <div className="flex-1 overflow-y-auto p-6 space-y-4">
             {messages.map((msg, idx) => (
-              <div
-                key={idx}
-                className={`flex ${msg.role === 'user' ? 'justify-end' : 'justify-start'}`}
-              >
-                <div
-                  className={`max-w-[80%] rounded-2xl px-4 py-3 ${
-                    msg.role === 'user'
-                      ? 'bg-gradient-to-r from-blue-500 to-purple-600 text-white'
-                      : 'bg-white/60 backdrop-blur-md border border-white/20 text-gray-800'
-                  }`}
-                  style={{
-                    boxShadow: msg.role === 'user'
-                      ? '0 4px 12px rgba(99, 102, 241, 0.3)'
-                      : '0 2px 8px rgba(0, 0, 0, 0.1)',
-                  }}
-                >
-                  <p className="text-sm leading-relaxed whitespace-pre-wrap">
-                    {msg.content}
-                  </p>
-                </div>
-              </div>
+              <ChatBubble key={idx} role={msg.role} content={msg.content} />
             ))}
             {isLoading && (
               <div className="flex justify-start">
@@ -226,4 +233,6 @@ export function AILogoTrigger({ onClick }: AILogoTriggerProps) {
   );
 }
 
-export default AIChat;
+// Memoized so dashboard state changes (hovering the radial menu, switching
+// workflows) don't re-render the chat panel unless its own props change
+export default React.memo(AIChat);
@@ -84,9 +84,10 @@ export default function Analytics() {
     const days = tf === '1W' ? 7 : tf === '1M' ? 30 : tf === '3M' ? 90 : tf === '1Y' ? 365 : 365;
     const data: DailyPerformance[] = [];
     let portfolioValue = 100000;
+    const today = new Date();
 
     for (let i = days - 1; i >= 0; i--) {
-      const date = new Date();
+      const date = new Date(today);
       date.setDate(date.getDate() - i);
       const pnl = (Math.random() - 0.45) * 500;
       portfolioValue += pnl;
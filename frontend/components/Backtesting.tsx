@@ -4,6 +4,17 @@ import { BarChart3, TrendingUp, TrendingDown, Activity, DollarSign, Percent, Pla
 import { Card, Button, Input, Select } from './ui';
 import { theme } from '../styles/theme';
 
+// Mock backtests always cover the same year, so the date axis is built once
+// and shared by the equity curve and trade history instead of per run
+const MOCK_BACKTEST_DATES: string[] = (() => {
+  const startDate = new Date('2024-01-01');
+  return Array.from({ length: 365 }, (_, i) => {
+    const date = new Date(startDate);
+    date.setDate(date.getDate() + i);
+    return date.toISOString().split('T')[0];
+  });
+})();
+
 interface BacktestConfig {
   symbol: string;
   startDate: string;
@@ -77,15 +88,12 @@ export default function Backtesting() {
   const generateEquityCurve = () => {
     const curve = [];
     let value = 10000;
-    const startDate = new Date('2024-01-01');
 
-    for (let i = 0; i < 365; i++) {
-      const date = new Date(startDate);
-      date.setDate(date.getDate() + i);
+    for (let i = 0; i < MOCK_BACKTEST_DATES.length; i++) {
       const change = (Math.random() - 0.45) * 150;
       value += change;
       curve.push({
-        date: date.toISOString().split('T')[0],
+        date: MOCK_BACKTEST_DATES[i],
         value: Math.max(8000, value),
       });
     }
@@ -97,10 +105,8 @@ export default function Backtesting() {
     const types: ('buy' | 'sell')[] = ['buy', 'sell'];
 
     for (let i = 0; i < 10; i++) {
-      const date = new Date('2024-01-01');
-      date.setDate(date.getDate() + i * 36);
       trades.push({
-        date: date.toISOString().split('T')[0],
+        date: MOCK_BACKTEST_DATES[i * 36],
         type: types[i % 2],
         price: 450 + Math.random() * 50,
         quantity: Math.floor(Math.random() * 20) + 1,
@@ -31,9 +31,9 @@ interface NewsItem {
 }
 
 export default function MorningRoutine() {
-  const [currentTime, setCurrentTime] = useState(new Date());
+  const [currentTime, setCurrentTime] = useState(() => new Date());
   const [loading, setLoading] = useState(false);
-  const [systemChecks] = useState<SystemCheck[]>([
+  const [systemChecks] = useState<SystemCheck[]>(() => [
     { name: 'API Connection', status: 'pass', message: 'Connected to Alpaca' },
     { name: 'Market Data', status: 'pass', message: 'Real-time feed active' },
     { name: 'Account Status', status: 'pass', message: 'Paper trading account active' },
@@ -47,7 +47,7 @@ export default function MorningRoutine() {
     buyingPower: 8500.00,
   });
 
-  const [todaysNews] = useState<NewsItem[]>([
+  const [todaysNews] = useState<NewsItem[]>(() => [
     { title: 'Fed Interest Rate Decision', impact: 'high', time: '2:00 PM ET' },
     { title: 'Tech Earnings: AAPL, MSFT', impact: 'high', time: 'After Close' },
     { title: 'Unemployment Claims', impact: 'medium', time: '8:30 AM ET' },
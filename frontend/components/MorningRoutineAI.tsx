@@ -121,7 +121,7 @@ ${data.candidates.map((stock: any, idx: number) => `
 
 export default function MorningRoutineAI() {
   const [view, setView] = useState<'dashboard' | 'scheduler'>('dashboard');
-  const [currentTime, setCurrentTime] = useState(new Date());
+  const [currentTime, setCurrentTime] = useState(() => new Date());
   const [loading, setLoading] = useState(false);
 
   // "Run Now" feature state
@@ -130,7 +130,7 @@ export default function MorningRoutineAI() {
   const [showExecutionLog, setShowExecutionLog] = useState(false);
 
   // Dashboard data
-  const [systemChecks] = useState<SystemCheck[]>([
+  const [systemChecks] = useState<SystemCheck[]>(() => [
     { name: 'API Connection', status: 'pass', message: 'Connected to Alpaca' },
     { name: 'Market Data', status: 'pass', message: 'Real-time feed active' },
     { name: 'Account Status', status: 'pass', message: 'Paper trading account active' },
@@ -144,7 +144,7 @@ export default function MorningRoutineAI() {
     buyingPower: 0,
   });
 
-  const [todaysNews] = useState<NewsItem[]>([
+  const [todaysNews] = useState<NewsItem[]>(() => [
     { title: 'Fed Interest Rate Decision', impact: 'high', time: '2:00 PM ET' },
     { title: 'Tech Earnings: AAPL, MSFT', impact: 'high', time: 'After Close' },
     { title: 'Unemployment Claims', impact: 'medium', time: '8:30 AM ET' },
@@ -14,6 +14,28 @@ interface Position {
   unrealizedPnLPercent: number;
 }
 
+// Row cell styles depend only on the theme, so they're built once and shared
+// by every cell instead of allocated per cell on each render. The P&L color is
+// picked per row from two prebuilt styles rather than styled cell by cell.
+const symbolCellStyle = { padding: theme.spacing.md };
+const symbolTextStyle = {
+  fontWeight: '700',
+  fontSize: '16px',
+  color: theme.colors.secondary
+};
+const valueCellStyle = {
+  padding: theme.spacing.md,
+  color: theme.colors.text,
+  textAlign: 'right' as const
+};
+const marketValueCellStyle = { ...valueCellStyle, fontWeight: '600' };
+const profitCellStyle = { ...marketValueCellStyle, color: theme.colors.primary };
+const lossCellStyle = { ...marketValueCellStyle, color: theme.colors.danger };
+const rowStyle = {
+  borderBottom: `1px solid ${theme.colors.border}`,
+  transition: 'background 0.2s'
+};
+
 export default function PositionsTable() {
   const [positions, setPositions] = useState<Position[]>([]);
   const [error, setError] = useState<string | null>(null);
@@ -331,65 +353,31 @@ export default function PositionsTable() {
               <tbody>
                 {positions.map((pos, i) => {
                   const isProfit = pos.unrealizedPnL >= 0;
-                  const pnlColor = isProfit ? theme.colors.primary : theme.colors.danger;
+                  const pnlCellStyle = isProfit ? profitCellStyle : lossCellStyle;
 
                   return (
-                    <tr key={i} style={{
-                      borderBottom: `1px solid ${theme.colors.border}`,
-                      transition: 'background 0.2s'
-                    }}>
-                      <td style={{ padding: theme.spacing.md }}>
-                        <span style={{
-                          fontWeight: '700',
-                          fontSize: '16px',
-                          color: theme.colors.secondary
-                        }}>
+                    <tr key={i} style={rowStyle}>
+                      <td style={symbolCellStyle}>
+                        <span style={symbolTextStyle}>
                           {pos.symbol}
                         </span>
                       </td>
-                      <td style={{
-                        padding: theme.spacing.md,
-                        color: theme.colors.text,
-                        textAlign: 'right'
-                      }}>
+                      <td style={valueCellStyle}>
                         {pos.qty}
                       </td>
-                      <td style={{
-                        padding: theme.spacing.md,
-                        color: theme.colors.text,
-                        textAlign: 'right'
-                      }}>
+                      <td style={valueCellStyle}>
                         ${pos.avgPrice.toFixed(2)}
                       </td>
-                      <td style={{
-                        padding: theme.spacing.md,
-                        color: theme.colors.text,
-                        textAlign: 'right'
-                      }}>
+                      <td style={valueCellStyle}>
                         ${pos.currentPrice.toFixed(2)}
                       </td>
-                      <td style={{
-                        padding: theme.spacing.md,
-                        color: theme.colors.text,
-                        fontWeight: '600',
-                        textAlign: 'right'
-                      }}>
+                      <td style={marketValueCellStyle}>
                         ${pos.marketValue.toFixed(2)}
                       </td>
-                      <td style={{
-                        padding: theme.spacing.md,
-                        color: pnlColor,
-                        fontWeight: '600',
-                        textAlign: 'right'
-                      }}>
+                      <td style={pnlCellStyle}>
                         {isProfit ? '+' : ''}${pos.unrealizedPnL.toFixed(2)}
                       </td>
-                      <td style={{
-                        padding: theme.spacing.md,
-                        color: pnlColor,
-                        fontWeight: '600',
-                        textAlign: 'right'
-                      }}>
+                      <td style={pnlCellStyle}>
                         {isProfit ? '+' : ''}{pos.unrealizedPnLPercent.toFixed(2)}%
                       </td>
                     </tr>
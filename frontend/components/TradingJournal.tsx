@@ -1,5 +1,5 @@
 "use client";
-import { useState, useEffect } from 'react';
+import { useState, useEffect, useMemo } from 'react';
 import { BookOpen, Plus, Edit2, Trash2, Filter, Search, TrendingUp, TrendingDown, Tag } from 'lucide-react';
 import { Card, Button, Input, Select } from './ui';
 import { theme } from '../styles/theme';
@@ -91,14 +91,23 @@ export default function TradingJournal() {
     setEntries(mockEntries);
   };
 
-  const filteredEntries = entries.filter(entry => {
+  // Lowercased search fields, rebuilt only when entries change (not per keystroke)
+  const searchIndex = useMemo(() => entries.map(entry => ({
+    entry,
+    symbol: entry.symbol.toLowerCase(),
+    strategy: entry.strategy.toLowerCase(),
+    tags: entry.tags.map(tag => tag.toLowerCase()),
+  })), [entries]);
+
+  const term = searchTerm.toLowerCase();
+  const filteredEntries = searchIndex.filter(({ entry, symbol, strategy, tags }) => {
     const matchesFilter = filter === 'all' || entry.outcome === filter || (filter === 'wins' && entry.outcome === 'win') || (filter === 'losses' && entry.outcome === 'loss');
-    const matchesSearch = !searchTerm ||
-      entry.symbol.toLowerCase().includes(searchTerm.toLowerCase()) ||
-      entry.strategy.toLowerCase().includes(searchTerm.toLowerCase()) ||
-      entry.tags.some(tag => tag.toLowerCase().includes(searchTerm.toLowerCase()));
+    const matchesSearch = !term ||
+      symbol.includes(term) ||
+      strategy.includes(term) ||
+      tags.some(tag => tag.includes(term));
     return matchesFilter && matchesSearch;
-  });
+  }).map(({ entry }) => entry);
 
   const stats = {
     total: entries.length,
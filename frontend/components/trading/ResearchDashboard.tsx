@@ -118,21 +118,24 @@ export default function ResearchDashboard() {
     setLoading(true);
     try {
       // Fetch stock fundamentals (mock for now)
-      await new Promise(resolve => setTimeout(resolve, 300));
-      setStockData({
-        symbol: symbol.toUpperCase(),
-        price: 184.10,
-        change: 1.60,
-        changePct: 0.88,
-        marketCap: 2800000000000,
-        peRatio: 28.5,
-        earningsDate: '2025-01-30',
-        week52High: 199.62,
-        week52Low: 164.08,
-      });
+      const loadFundamentals = async () => {
+        await new Promise(resolve => setTimeout(resolve, 300));
+        setStockData({
+          symbol: symbol.toUpperCase(),
+          price: 184.10,
+          change: 1.60,
+          changePct: 0.88,
+          marketCap: 2800000000000,
+          peRatio: 28.5,
+          earningsDate: '2025-01-30',
+          week52High: 199.62,
+          week52Low: 164.08,
+        });
+      };
 
-      // Fetch historical data
-      await fetchHistoricalData(symbol, timeframe);
+      // Fundamentals and historical bars are independent, so fetch them
+      // together: the search waits for the slower one, not both in turn
+      await Promise.all([loadFundamentals(), fetchHistoricalData(symbol, timeframe)]);
     } catch (e) {
       console.error('Failed to fetch stock data', e);
     } finally {
@@ -381,6 +384,49 @@ Proposal system coming in INCREMENT 9`);
     return results;
   }, [historicalData, indicators]);
 
+  // Bar timestamps in chart seconds, parsed once per fetch and shared by
+  // every series below
+  const barTimes = useMemo(
+    () => historicalData.map(bar => new Date(bar.time).getTime() / 1000),
+    [historicalData]
+  );
+
+  // Price series data only depends on the bars, so switching chart type
+  // just swaps series instead of re-mapping the whole history
+  const candlestickData = useMemo<CandlestickData[]>(
+    () => historicalData.map((bar, i) => ({
+      time: barTimes[i] as any,
+      open: bar.open,
+      high: bar.high,
+      low: bar.low,
+      close: bar.close,
+    })),
+    [historicalData, barTimes]
+  );
+
+  const closeData = useMemo<LineData[]>(
+    () => historicalData.map((bar, i) => ({
+      time: barTimes[i] as any,
+      value: bar.close,
+    })),
+    [historicalData, barTimes]
+  );
+
+  // Volume bars and their up/down colors only depend on the price data,
+  // so compute them once per fetch rather than on every indicator toggle
+  const volumeData = useMemo<HistogramData[]>(() => {
+    const data: HistogramData[] = new Array(historicalData.length);
+    for (let i = 0; i < historicalData.length; i++) {
+      const bar = historicalData[i];
+      data[i] = {
+        time: barTimes[i] as any,
+        value: bar.volume,
+        color: bar.close >= bar.open ? '#10b981' : '#ef4444',
+      };
+    }
+    return data;
+  }, [historicalData, barTimes]);
+
   // Initialize charts
   useEffect(() => {
     // Price Chart
@@ -542,14 +588,6 @@ Proposal system coming in INCREMENT 9`);
         wickDownColor: '#ef4444',
       });
 
-      const candlestickData: CandlestickData[] = historicalData.map(bar => ({
-        time: new Date(bar.time).getTime() / 1000 as any,
-        open: bar.open,
-        high: bar.high,
-        low: bar.low,
-        close: bar.close,
-      }));
-
       series.setData(candlestickData);
     } else if (chartType === 'Line') {
       series = priceChartRef.current.addLineSeries({
@@ -557,12 +595,7 @@ Proposal system coming in INCREMENT 9`);
         lineWidth: 2,
       });
 
-      const lineData: LineData[] = historicalData.map(bar => ({
-        time: new Date(bar.time).getTime() / 1000 as any,
-        value: bar.close,
-      }));
-
-      series.setData(lineData);
+      series.setData(closeData);
     } else {
       // Area
       series = priceChartRef.current.addAreaSeries({
@@ -572,17 +605,12 @@ Proposal system coming in INCREMENT 9`);
         lineWidth: 2,
       });
 
-      const areaData: LineData[] = historicalData.map(bar => ({
-        time: new Date(bar.time).getTime() / 1000 as any,
-        value: bar.close,
-      }));
-
-      series.setData(areaData);
+      series.setData(closeData);
     }
 
     priceSeriesRef.current = series;
     priceChartRef.current.timeScale().fitContent();
-  }, [historicalData, chartType]);
+  }, [historicalData, chartType, candlestickData, closeData]);
 
   // Update indicators
   useEffect(() => {
@@ -854,7 +882,7 @@ Proposal system coming in INCREMENT 9`);
 
   // Update Volume chart
   useEffect(() => {
-    if (!volumeChartRef.current || historicalData.length === 0) return;
+    if (!volumeChartRef.current || volumeData.length === 0) return;
 
     const chart = volumeChartRef.current;
     chart.remove();
@@ -889,12 +917,6 @@ Proposal system coming in INCREMENT 9`);
         },
       });
 
-      const volumeData: HistogramData[] = historicalData.map(bar => ({
-        time: new Date(bar.time).getTime() / 1000 as any,
-        value: bar.volume,
-        color: bar.close >= bar.open ? '#10b981' : '#ef4444',
-      }));
-
       volumeSeries.setData(volumeData);
       newChart.timeScale().fitContent();
 
@@ -908,7 +930,7 @@ Proposal system coming in INCREMENT 9`);
         });
       }
     }
-  }, [historicalData, indicators]);
+  }, [volumeData, indicators]);
 
   // Refetch data when timeframe changes
   useEffect(() => {
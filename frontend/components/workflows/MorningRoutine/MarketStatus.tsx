@@ -8,7 +8,7 @@ interface MarketHours {
 }
 
 export const MarketStatus: React.FC = () => {
-  const [currentTime, setCurrentTime] = useState(new Date());
+  const [currentTime, setCurrentTime] = useState(() => new Date());
   const [marketHours, setMarketHours] = useState<MarketHours>({
     isOpen: false,
     nextEvent: 'Market Open',
@@ -227,9 +227,10 @@ export function checkPerformanceInfo(
  * Seed mock data for testing (optional)
  */
 export function seedMockTradeData(strategyId: string, userId: string) {
-  // Generate 20 mock trades
+  // Generate 20 mock trades, spaced from a single clock read
+  const now = Date.now();
   for (let i = 0; i < 20; i++) {
-    const enteredAt = new Date(Date.now() - (20 - i) * 7 * 24 * 60 * 60 * 1000); // Weekly trades
+    const enteredAt = new Date(now - (20 - i) * 7 * 24 * 60 * 60 * 1000); // Weekly trades
     const closedAt = new Date(enteredAt.getTime() + 5 * 24 * 60 * 60 * 1000); // 5 day hold
     const isWinner = Math.random() > 0.35; // 65% win rate
     const pnl = isWinner ? Math.random() * 500 + 100 : -(Math.random() * 300 + 50);
@@ -46,6 +46,86 @@ function getAlpacaParams(timeframe: Timeframe): { timeframe: string; limit: numb
   return map[timeframe];
 }
 
+/**
+ * Round to 2 decimals without the toFixed/parseFloat string round-trip
+ */
+function round2(value: number): number {
+  return Math.round(value * 100) / 100;
+}
+
+/**
+ * Small seeded PRNG (mulberry32) so mock series are repeatable
+ */
+function seededRandom(seed: number): () => number {
+  let state = seed >>> 0;
+  return () => {
+    state = (state + 0x6D2B79F5) >>> 0;
+    let t = state;
+    t = Math.imul(t ^ (t >>> 15), t | 1);
+    t ^= t + Math.imul(t ^ (t >>> 7), t | 61);
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+  };
+}
+
+/**
+ * FNV-1a hash of a string, used as the mock data seed
+ */
+function hashSeed(text: string): number {
+  let h = 0x811c9dc5;
+  for (let i = 0; i < text.length; i++) {
+    h ^= text.charCodeAt(i);
+    h = Math.imul(h, 0x01000193);
+  }
+  return h >>> 0;
+}
+
+const HOUR_MS = 3600000;
+const MOCK_CACHE_MAX = 256;
+const mockBarsCache = new Map<string, BarData[]>();
+
+/**
+ * Mock bars for a symbol/timeframe. Seeded by symbol and timeframe and anchored
+ * to the current hour, so the series is stable between refreshes (no chart
+ * jitter) and only generated once per hour per key. The key covers every
+ * argument, so a different limit never gets a cached series of the wrong length.
+ */
+function getMockBars(symbol: string, timeframe: Timeframe, limit: number): BarData[] {
+  const hourStart = Math.floor(Date.now() / HOUR_MS) * HOUR_MS;
+  const key = `${symbol}|${timeframe}|${limit}|${hourStart}`;
+  const cached = mockBarsCache.get(key);
+  if (cached) {
+    return cached;
+  }
+
+  // Generate realistic mock data in a single pass into a preallocated array
+  const random = seededRandom(hashSeed(`${symbol}|${timeframe}`));
+  const basePrice = 180 + random() * 20;
+  const startMs = hourStart - limit * HOUR_MS;
+  const bars: BarData[] = new Array(limit);
+  for (let i = 0; i < limit; i++) {
+    const volatility = 2 + random() * 3;
+    const open = basePrice + (random() - 0.5) * volatility;
+    const close = open + (random() - 0.5) * volatility;
+    const high = (open > close ? open : close) + random() * volatility;
+    const low = (open < close ? open : close) - random() * volatility;
+
+    bars[i] = {
+      time: new Date(startMs + i * HOUR_MS).toISOString(),
+      open: round2(open),
+      high: round2(high),
+      low: round2(low),
+      close: round2(close),
+      volume: Math.floor(1000000 + random() * 5000000)
+    };
+  }
+
+  if (mockBarsCache.size >= MOCK_CACHE_MAX) {
+    mockBarsCache.clear();
+  }
+  mockBarsCache.set(key, bars);
+  return bars;
+}
+
 /**
  * Historical Market Data API
  *
@@ -91,26 +171,7 @@ export default async function handler(req: NextApiRequest, res: NextApiResponse)
     if (!hasValidKeys) {
       console.log('Using mock data (Alpaca API keys not configured)');
 
-      // Generate realistic mock data
-      const now = Date.now();
-      const basePrice = 180 + Math.random() * 20;
-      const bars: BarData[] = Array.from({ length: params.limit }, (_, i) => {
-        const timestamp = new Date(now - (params.limit - i) * 3600000).toISOString();
-        const volatility = 2 + Math.random() * 3;
-        const open = basePrice + (Math.random() - 0.5) * volatility;
-        const close = open + (Math.random() - 0.5) * volatility;
-        const high = Math.max(open, close) + Math.random() * volatility;
-        const low = Math.min(open, close) - Math.random() * volatility;
-
-        return {
-          time: timestamp,
-          open: parseFloat(open.toFixed(2)),
-          high: parseFloat(high.toFixed(2)),
-          low: parseFloat(low.toFixed(2)),
-          close: parseFloat(close.toFixed(2)),
-          volume: Math.floor(1000000 + Math.random() * 5000000)
-        };
-      });
+      const bars = getMockBars(symbol.toUpperCase(), timeframe as Timeframe, params.limit);
 
       const lastBar = bars[bars.length - 1];
       const firstBar = bars[0];
@@ -122,7 +183,7 @@ export default async function handler(req: NextApiRequest, res: NextApiResponse)
         bars,
         count: bars.length,
         currentPrice: lastBar.close,
-        priceChange: parseFloat(priceChange.toFixed(2))
+        priceChange: round2(priceChange)
       });
     }
 
@@ -156,19 +156,39 @@ function transformAlpacaOptions(alpacaData: any, symbol: string): OptionsChainRe
   };
 }
 
+const MOCK_EXPIRATIONS = [
+  '2025-01-17',
+  '2025-01-24',
+  '2025-02-21',
+  '2025-03-21',
+  '2025-06-20',
+  '2026-01-16',
+];
+
+// The mock chain is a pure function of (symbol, expiration), so build each one
+// once per server instance instead of recomputing the greeks on every fallback
+const MOCK_CHAIN_CACHE_MAX = 256;
+const mockChainCache = new Map<string, OptionsChainResponse>();
+
+function generateMockOptionsChain(symbol: string, expiration?: string): OptionsChainResponse {
+  const key = `${symbol}|${expiration || ''}`;
+  let chain = mockChainCache.get(key);
+  if (!chain) {
+    if (mockChainCache.size >= MOCK_CHAIN_CACHE_MAX) {
+      mockChainCache.clear();
+    }
+    chain = buildMockOptionsChain(symbol, expiration);
+    mockChainCache.set(key, chain);
+  }
+  return chain;
+}
+
 /**
  * Generate mock options chain data for demo purposes
  */
-function generateMockOptionsChain(symbol: string, expiration?: string): OptionsChainResponse {
+function buildMockOptionsChain(symbol: string, expiration?: string): OptionsChainResponse {
   const underlyingPrice = 184.10;
-  const expirations = [
-    '2025-01-17',
-    '2025-01-24',
-    '2025-02-21',
-    '2025-03-21',
-    '2025-06-20',
-    '2026-01-16',
-  ];
+  const expirations = MOCK_EXPIRATIONS;
 
   const selectedExpiration = expiration || expirations[2];
   const atmStrike = Math.round(underlyingPrice / 5) * 5;
@@ -50,6 +50,19 @@ const ALLOW_DELETE = new Set<string>([
   "watchlists",
 ]);
 
+// Precompiled per-method matchers: exact endpoint or any sub-path of it
+// (e.g. "market/quote" also allows "market/quote/AAPL")
+function toPathMatcher(allowed: Set<string>): RegExp {
+  const escaped = Array.from(allowed).map(p => p.replace(/[.*+?^${}()|[\]\\]/g, "\\$&"));
+  return new RegExp(`^(?:${escaped.join("|")})(?:/|$)`);
+}
+
+const ALLOW_MATCHERS: Record<string, RegExp> = {
+  GET: toPathMatcher(ALLOW_GET),
+  POST: toPathMatcher(ALLOW_POST),
+  DELETE: toPathMatcher(ALLOW_DELETE),
+};
+
 function isAllowedOrigin(req: NextApiRequest) {
   const origin = (req.headers.origin || "").toLowerCase();
   const prod = (process.env.PUBLIC_SITE_ORIGIN || "").toLowerCase();
@@ -67,7 +80,7 @@ export default async function handler(req: NextApiRequest, res: NextApiResponse)
   if (req.method === "OPTIONS") {
     res.setHeader("access-control-allow-origin", req.headers.origin ?? "");
     res.setHeader("access-control-allow-methods", "GET,POST,DELETE,OPTIONS");
-    res.setHeader("access-control-allow-headers", "content-type,x-request-id");
+    res.setHeader("access-control-allow-headers", "content-type,x-request-id,if-none-match");
     res.status(204).end();
     return;
   }
@@ -87,30 +100,9 @@ export default async function handler(req: NextApiRequest, res: NextApiResponse)
   }
 
   // Check if path is allowed based on method
-  if (req.method === "GET" && !ALLOW_GET.has(path)) {
-    // Allow wildcard patterns for dynamic routes
-    const isAllowedPattern = Array.from(ALLOW_GET).some(allowed =>
-      path.startsWith(allowed + "/") || path === allowed
-    );
-    if (!isAllowedPattern) {
-      return res.status(405).json({ error: "Not allowed" });
-    }
-  }
-  if (req.method === "POST" && !ALLOW_POST.has(path)) {
-    const isAllowedPattern = Array.from(ALLOW_POST).some(allowed =>
-      path.startsWith(allowed + "/") || path === allowed
-    );
-    if (!isAllowedPattern) {
-      return res.status(405).json({ error: "Not allowed" });
-    }
-  }
-  if (req.method === "DELETE" && !ALLOW_DELETE.has(path)) {
-    const isAllowedPattern = Array.from(ALLOW_DELETE).some(allowed =>
-      path.startsWith(allowed + "/") || path === allowed
-    );
-    if (!isAllowedPattern) {
-      return res.status(405).json({ error: "Not allowed" });
-    }
+  const matcher = ALLOW_MATCHERS[req.method || ""];
+  if (matcher && !matcher.test(path)) {
+    return res.status(405).json({ error: "Not allowed" });
   }
 
   const url = `${BACKEND}/api/${path}`;
@@ -123,6 +115,10 @@ export default async function handler(req: NextApiRequest, res: NextApiResponse)
   const rid = (req.headers["x-request-id"] as string) || "";
   if (rid) headers["x-request-id"] = rid;
 
+  // pass the client's cached ETag through so the backend can answer 304
+  const inm = (req.headers["if-none-match"] as string) || "";
+  if (inm) headers["if-none-match"] = inm;
+
   // Enhanced debug logging
   console.log(`\n[PROXY] ====== New Request ======`);
   console.log(`[PROXY] Method: ${req.method}`);
@@ -149,6 +145,14 @@ export default async function handler(req: NextApiRequest, res: NextApiResponse)
     console.log(`[PROXY] Response body: ${text.substring(0, 200)}${text.length > 200 ? '...' : ''}`);
     console.log(`[PROXY] ====== End Request ======\n`);
 
+    const etag = upstream.headers.get("etag");
+    if (etag) res.setHeader("etag", etag);
+
+    if (upstream.status === 304) {
+      res.status(304).end();
+      return;
+    }
+
     res
       .status(upstream.status)
       .setHeader("content-type", upstream.headers.get("content-type") || "application/json")
@@ -1,4 +1,4 @@
-import { useState, useEffect } from 'react';
+import { useState, useEffect, useCallback } from 'react';
 import Split from 'react-split';
 import RadialMenu, { workflows, Workflow } from '../components/RadialMenu';
 import PositionsTable from '../components/PositionsTable';
@@ -30,6 +30,7 @@ export default function Dashboard() {
   const [isUserSetup, setIsUserSetup] = useState(false); // Start with onboarding
   const [isLoading, setIsLoading] = useState(true);
   const [aiChatOpen, setAiChatOpen] = useState(false);
+  const closeAiChat = useCallback(() => setAiChatOpen(false), []);
 
   // Check if user is set up on mount
   useEffect(() => {
@@ -511,7 +512,7 @@ export default function Dashboard() {
       {/* AI Chat Modal */}
       <AIChat
         isOpen={aiChatOpen}
-        onClose={() => setAiChatOpen(false)}
+        onClose={closeAiChat}
         initialMessage="Hi! I'm your PaiiD AI assistant. I can help you with trading strategies, build custom workflows, analyze market data, or adjust your preferences. What would you like to know?"
       />
     </>
@@ -26,13 +26,18 @@ export interface LinePoint {
 export function calculateSMA(data: BarData[], period: number): LinePoint[] {
   if (data.length < period) return [];
 
+  // Rolling window sum: add the incoming close, drop the outgoing one
   const result: LinePoint[] = [];
-  for (let i = period - 1; i < data.length; i++) {
-    const sum = data.slice(i - period + 1, i + 1).reduce((acc, bar) => acc + bar.close, 0);
-    result.push({
-      time: data[i].time,
-      value: sum / period
-    });
+  let sum = 0;
+  for (let i = 0; i < data.length; i++) {
+    sum += data[i].close;
+    if (i >= period) sum -= data[i - period].close;
+    if (i >= period - 1) {
+      result.push({
+        time: data[i].time,
+        value: sum / period
+      });
+    }
   }
   return result;
 }
@@ -45,18 +50,27 @@ export function calculateRSI(data: BarData[], period: number = 14): LinePoint[]
   if (data.length < period + 1) return [];
 
   const result: LinePoint[] = [];
-  const changes: number[] = [];
+  const changes: number[] = new Array(data.length - 1);
 
   for (let i = 1; i < data.length; i++) {
-    changes.push(data[i].close - data[i - 1].close);
+    changes[i - 1] = data[i].close - data[i - 1].close;
   }
 
-  for (let i = period; i < changes.length; i++) {
-    const gains = changes.slice(i - period, i).filter(c => c > 0);
-    const losses = changes.slice(i - period, i).filter(c => c < 0).map(Math.abs);
+  // Rolling gain/loss sums over the last `period` changes. Counts are kept so
+  // an empty side is exactly 0 rather than a float residue from subtraction.
+  let gainSum = 0;
+  let lossSum = 0;
+  let gainCount = 0;
+  let lossCount = 0;
+  for (let i = 0; i < period; i++) {
+    const c = changes[i];
+    if (c > 0) { gainSum += c; gainCount++; }
+    else if (c < 0) { lossSum -= c; lossCount++; }
+  }
 
-    const avgGain = gains.length > 0 ? gains.reduce((a, b) => a + b, 0) / period : 0;
-    const avgLoss = losses.length > 0 ? losses.reduce((a, b) => a + b, 0) / period : 0;
+  for (let i = period; i < changes.length; i++) {
+    const avgGain = gainCount > 0 ? gainSum / period : 0;
+    const avgLoss = lossCount > 0 ? lossSum / period : 0;
 
     const rs = avgLoss === 0 ? 100 : avgGain / avgLoss;
     const rsi = 100 - (100 / (1 + rs));
@@ -65,6 +79,13 @@ export function calculateRSI(data: BarData[], period: number = 14): LinePoint[]
       time: data[i + 1].time,
       value: rsi
     });
+
+    const incoming = changes[i];
+    const outgoing = changes[i - period];
+    if (incoming > 0) { gainSum += incoming; gainCount++; }
+    else if (incoming < 0) { lossSum -= incoming; lossCount++; }
+    if (outgoing > 0) { gainSum -= outgoing; gainCount--; }
+    else if (outgoing < 0) { lossSum += outgoing; lossCount--; }
   }
 
   return result;
@@ -80,28 +101,39 @@ export function calculateMACD(
   slowPeriod: number = 26,
   signalPeriod: number = 9
 ) {
-  const ema = (values: number[], period: number): number[] => {
-    const k = 2 / (period + 1);
-    const result: number[] = [values[0]];
-    for (let i = 1; i < values.length; i++) {
-      result.push(values[i] * k + result[i - 1] * (1 - k));
+  // The three EMAs are first-order recurrences over the same bars, so run
+  // them together in one pass and emit the output points directly instead of
+  // building closes/EMA/line arrays and re-mapping each one
+  const n = data.length;
+  const kFast = 2 / (fastPeriod + 1);
+  const kSlow = 2 / (slowPeriod + 1);
+  const kSignal = 2 / (signalPeriod + 1);
+  const macd: LinePoint[] = new Array(n);
+  const signal: LinePoint[] = new Array(n);
+  const histogram: LinePoint[] = new Array(n);
+
+  let fastEMA = 0;
+  let slowEMA = 0;
+  let signalEMA = 0;
+  for (let i = 0; i < n; i++) {
+    const close = data[i].close;
+    if (i === 0) {
+      fastEMA = close;
+      slowEMA = close;
+    } else {
+      fastEMA = close * kFast + fastEMA * (1 - kFast);
+      slowEMA = close * kSlow + slowEMA * (1 - kSlow);
     }
-    return result;
-  };
+    const macdValue = fastEMA - slowEMA;
+    signalEMA = i === 0 ? macdValue : macdValue * kSignal + signalEMA * (1 - kSignal);
 
-  const closes = data.map(d => d.close);
-  const fastEMA = ema(closes, fastPeriod);
-  const slowEMA = ema(closes, slowPeriod);
-
-  const macdLine = fastEMA.map((fast, i) => fast - slowEMA[i]);
-  const signalLine = ema(macdLine, signalPeriod);
-  const histogram = macdLine.map((macd, i) => macd - signalLine[i]);
+    const time = data[i].time;
+    macd[i] = { time, value: macdValue };
+    signal[i] = { time, value: signalEMA };
+    histogram[i] = { time, value: macdValue - signalEMA };
+  }
 
-  return {
-    macd: macdLine.map((val, i) => ({ time: data[i].time, value: val })),
-    signal: signalLine.map((val, i) => ({ time: data[i].time, value: val })),
-    histogram: histogram.map((val, i) => ({ time: data[i].time, value: val }))
-  };
+  return { macd, signal, histogram };
 }
 
 /**
@@ -120,11 +152,22 @@ export function calculateBollingerBands(
     lower: []
   };
 
+  // Pull closes into one contiguous column so each window is scanned in place
+  // rather than sliced out of the bar objects
+  const closes = new Float64Array(data.length);
+  for (let i = 0; i < data.length; i++) closes[i] = data[i].close;
+
   for (let i = period - 1; i < data.length; i++) {
-    const slice = data.slice(i - period + 1, i + 1);
-    const mean = slice.reduce((acc, bar) => acc + bar.close, 0) / period;
-    const variance = slice.reduce((acc, bar) => acc + Math.pow(bar.close - mean, 2), 0) / period;
-    const std = Math.sqrt(variance);
+    const start = i - period + 1;
+    let sum = 0;
+    for (let j = start; j <= i; j++) sum += closes[j];
+    const mean = sum / period;
+    let squares = 0;
+    for (let j = start; j <= i; j++) {
+      const diff = closes[j] - mean;
+      squares += diff * diff;
+    }
+    const std = Math.sqrt(squares / period);
 
     result.upper.push({ time: data[i].time, value: mean + stdDev * std });
     result.lower.push({ time: data[i].time, value: mean - stdDev * std });
@@ -133,15 +176,27 @@ export function calculateBollingerBands(
   return result;
 }
 
+/**
+ * Highest high and lowest low of data[start, end)
+ * Scans the bars in place instead of slicing, mapping and spreading each window
+ */
+function windowHighLow(data: BarData[], start: number, end: number): [number, number] {
+  let high = -Infinity;
+  let low = Infinity;
+  for (let i = start; i < end; i++) {
+    if (data[i].high > high) high = data[i].high;
+    if (data[i].low < low) low = data[i].low;
+  }
+  return [high, low];
+}
+
 /**
  * Ichimoku Cloud
  * Comprehensive indicator showing support/resistance, trend direction, and momentum
  */
 export function calculateIchimoku(data: BarData[]) {
   const highLow = (period: number, index: number): number => {
-    const slice = data.slice(Math.max(0, index - period + 1), index + 1);
-    const high = Math.max(...slice.map(d => d.high));
-    const low = Math.min(...slice.map(d => d.low));
+    const [high, low] = windowHighLow(data, Math.max(0, index - period + 1), index + 1);
     return (high + low) / 2;
   };
 
@@ -176,7 +231,9 @@ export function calculateEMA(data: BarData[], period: number): LinePoint[] {
   const result: LinePoint[] = [];
 
   // Start with SMA for first value
-  const firstSMA = data.slice(0, period).reduce((acc, bar) => acc + bar.close, 0) / period;
+  let closeSum = 0;
+  for (let i = 0; i < period; i++) closeSum += data[i].close;
+  const firstSMA = closeSum / period;
   result.push({ time: data[period - 1].time, value: firstSMA });
 
   for (let i = period; i < data.length; i++) {
@@ -212,7 +269,9 @@ export function calculateATR(data: BarData[], period: number = 14): LinePoint[]
   const result: LinePoint[] = [];
 
   // First ATR is simple average
-  const firstATR = trueRanges.slice(0, period).reduce((a, b) => a + b, 0) / period;
+  let trSum = 0;
+  for (let i = 0; i < period; i++) trSum += trueRanges[i];
+  const firstATR = trSum / period;
   result.push({ time: data[period].time, value: firstATR });
 
   // Subsequent ATRs use smoothing
@@ -238,9 +297,7 @@ export function calculateStochastic(
   const kValues: LinePoint[] = [];
 
   for (let i = kPeriod - 1; i < data.length; i++) {
-    const slice = data.slice(i - kPeriod + 1, i + 1);
-    const high = Math.max(...slice.map(d => d.high));
-    const low = Math.min(...slice.map(d => d.low));
+    const [high, low] = windowHighLow(data, i - kPeriod + 1, i + 1);
     const close = data[i].close;
 
     const k = ((close - low) / (high - low)) * 100;
@@ -250,7 +307,8 @@ export function calculateStochastic(
   const dValues: LinePoint[] = [];
 
   for (let i = dPeriod - 1; i < kValues.length; i++) {
-    const sum = kValues.slice(i - dPeriod + 1, i + 1).reduce((acc, val) => acc + val.value, 0);
+    let sum = 0;
+    for (let j = i - dPeriod + 1; j <= i; j++) sum += kValues[j].value;
     dValues.push({ time: kValues[i].time, value: sum / dPeriod });
   }
 